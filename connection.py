@@ -1,5 +1,122 @@
+import contextlib
 import socket
+import errno
 import time
+import sys
+
+
+# The max amount of buffers, that are passed to a single sendmsg call (The IOV_MAX limit of most systems)
+IOV_MAX = 1024
+
+# The error numbers of failed connect calls, after which the socket can be used for the next attempt right away. On
+# linux a socket, whose connection was refused, returns to the unconnected state. POSIX leaves the state of the socket
+# unspecified after a failed connect though, so on other platforms the socket is always recreated
+REUSABLE_CONNECT_ERRNOS = (errno.ECONNREFUSED, ) if sys.platform.startswith("linux") else ()
+
+
+
+def sendall_buffers(sock, buffers):
+    """
+    This function sends all the given buffers over the socket, without concatenating them into one bytes object first.
+    The buffers are handed to the 'sendmsg' method of the socket, which gathers them directly within the kernel. Since
+    sendmsg may only send a part of the data, the function keeps calling it with the remaining data until everything
+    has been sent. On systems without sendmsg the buffers are joined and sent with sendall.
+    Args:
+        sock: The socket object over which to send the data
+        buffers: A list of bytes like objects to be sent in the given order
+
+    Returns:
+    void
+    """
+    if not hasattr(sock, "sendmsg"):
+        sock.sendall(b''.join(buffers))
+        return
+
+    # The memoryviews make it possible to slice a partially sent buffer without copying it
+    views = [memoryview(buffer).cast("B") for buffer in buffers if len(buffer) > 0]
+    while views:
+        sent = sock.sendmsg(views[:IOV_MAX])
+        # Removing all the buffers, that have been sent completely and slicing the one, that was sent partially
+        while views and sent >= len(views[0]):
+            sent -= len(views[0])
+            del views[0]
+        if sent > 0:
+            views[0] = views[0][sent:]
+
+
+def recv_into_view(sock, view, offset=0):
+    """
+    This function receives data from the socket directly into the given memoryview, until it is filled completely.
+    The data is never received beyond the end of the view, so nothing has to be buffered afterwards. This is the inner
+    loop of every reception of a known length, all the objects used within it are bound to local names.
+    Raises:
+        EOFError: In case the data stream terminated before the view was filled
+    Args:
+        sock: The socket object from which to receive
+        view: The writable memoryview of bytes to fill
+        offset: The int amount of bytes at the front of the view, that are already filled
+
+    Returns:
+    void
+    """
+    recv_into = sock.recv_into
+    length = len(view)
+    while offset < length:
+        received = recv_into(view[offset:])
+
+        # In case there can be no more data received, but the view is not filled yet, raising End of file error
+        if not received:
+            raise EOFError("Only received ({}|{}) bytes from the socket".format(offset, length))
+
+        offset += received
+
+
+def take_front(buffer, length, consumed=None):
+    """
+    This function removes bytes from the front of the given receive buffer and returns the first length of them.
+    Args:
+        buffer: The bytearray, from which to take the bytes
+        length: The int amount of bytes to return
+        consumed: The int amount of bytes to remove from the buffer, for example including a break character, that is
+            not returned. On default the same as length
+
+    Returns:
+    The bytes taken from the front of the buffer
+    """
+    # The bytes are copied out of the buffer through a memoryview, slicing the bytearray itself would create an
+    # intermediate copy. The view has to be released before the buffer can be resized
+    with memoryview(buffer) as view:
+        data = bytes(view[:length])
+    del buffer[:length if consumed is None else consumed]
+    return data
+
+
+@contextlib.contextmanager
+def socket_timeout(sock, timeout):
+    """
+    This context manager sets the timeout of the given socket for the duration of the with block and restores the
+    previous timeout afterwards. This way the timeout of a reception is being watched by the kernel within the recv
+    calls themselves and there is no need to check the time with every iteration of a receive loop. A socket timeout
+    within the block is raised as a TimeoutError.
+    Notes:
+        Setting and restoring the timeout is not locked. The socket must only be used by a single thread while the
+        block runs, since any other send or receive call on it would run with the temporary timeout and a timeout set
+        by another thread in the meantime would be overwritten when the previous one is restored.
+    Args:
+        sock: The socket object, whose timeout to set
+        timeout: The float amount of seconds every recv call is allowed to wait. None for blocking indefinitely
+
+    Returns:
+    void
+    """
+    previous_timeout = sock.gettimeout()
+    sock.settimeout(timeout)
+    try:
+        yield
+    except socket.timeout:
+        raise TimeoutError("No data was received within {} seconds".format(timeout))
+    finally:
+        sock.settimeout(previous_timeout)
 
 
 class SocketWrapper:
@@ -7,10 +124,34 @@ class SocketWrapper:
     GENERAL
     This object wraps a socket connection and adds some additional functionality. A wrapped socket will be able to
     receive data until a certain character is received, only receive a certain length
+
+    RECEIVE BUFFER
+    Data is not received from the socket byte by byte, but in chunks of the size 'chunk_size'. All the bytes, that
+    have been received from the socket, but were not yet requested by one of the receive methods, are kept in the
+    internal receive buffer and will be used first by the next receive call.
+
+    SOCKET OPTIONS
+    The kernel buffers of the wrapped socket are set to the sizes 'rcvbuf' and 'sndbuf', which can either be passed to
+    the constructor or changed for all wrappers by overwriting the class attributes. For TCP sockets the Nagle
+    algorithm is being disabled (TCP_NODELAY), because the form protocol sends a lot of small messages, which then
+    each would be delayed until the ack of the previous one arrived.
     """
-    def __init__(self, sock, connected):
+    # The max amount of bytes requested from the socket with every single recv call
+    chunk_size = 4096
+    # The default sizes of the kernel receive and send buffers of the socket in bytes
+    rcvbuf = 1048576
+    sndbuf = 1048576
+
+    def __init__(self, sock, connected, rcvbuf=None, sndbuf=None):
         # Assigning the socket object to the variable
         self.sock = sock
+        # The sizes of the socket buffers, that are applied to the socket. If not given the class defaults are used
+        if rcvbuf is not None:
+            self.rcvbuf = rcvbuf
+        if sndbuf is not None:
+            self.sndbuf = sndbuf
+        # The buffer for the data, that has already been received from the socket but was not yet requested
+        self._rbuf = bytearray()
         # The variable, which stores the state of the connection
         self.connected = connected
         # The properties, that describe the type of the socket
@@ -18,11 +159,14 @@ class SocketWrapper:
         self.appoint_family()
         self.type = None
         self.appoint_type()
+        self.apply_socket_options()
 
     def connect(self, ip, port, attempts, delay):
         """
         This method capsules the connect functionality of the wrapped socket. The method will try to connect to the
-        specified address, trying that the specified amount of attempts.
+        specified address, trying that the specified amount of attempts. The first attempt is made right away, after
+        every failed attempt the delay until the next one is doubled (exponential backoff). After a refused attempt
+        the same socket is used again where the platform allows it, otherwise a new socket is created.
         In case an already connected socket is already stored in the wrapper, this method will close and connect to the
         new address (in case that is possible obviously).
         In case the connection could not be established after the specified amount of attempts, the method will raise
@@ -31,7 +175,8 @@ class SocketWrapper:
             ip: The string ip address of the target to connect to
             port: The integer port of the target to connect to
             attempts: The integer amount of attempts of trying to connect
-            delay: The float amount of seconds delayed to the next attempt
+            delay: The float amount of seconds delayed to the second attempt. The delay is doubled for every
+                following attempt
 
         Returns:
         void
@@ -42,39 +187,48 @@ class SocketWrapper:
         assert isinstance(attempts, int) and (0 <= attempts), "The attempts parameter is not the same value"
         # Assembling the port and the ip to the address tuple
         address = (ip, port)
+        # A connected socket can not connect again, it is closed and replaced right away instead of failing the first
+        # attempt. Data, that was buffered from a previous connection, must not be returned for the new one either
+        if self.connected:
+            self.renew_socket()
+            self.connected = False
+        self._rbuf.clear()
         # Calling the connect of the socket as many times as specified
-        while not self.connected:
+        for attempt in range(attempts):
             try:
-                # Delaying the try possibly
-                time.sleep(delay)
                 # Attempting to build the connection
                 self.sock.connect(address)
                 # Updating the connected status to True
                 self.connected = True
-            except Exception as exception:
-                # Closing the socket and creating a new one, which is gonna be used in the next try
-                self.sock.close()
-                self.sock = socket.socket(self.family, self.type)
+                break
+            except OSError as error:
+                # Closing the socket and creating a new one, which is gonna be used in the next try. Only in case the
+                # socket is still usable after the failed attempt it is kept, which saves the close and socket calls
+                if error.errno not in REUSABLE_CONNECT_ERRNOS:
+                    self.renew_socket()
                 self.connected = False
-                # Decrementing the counter for the attempts
-                attempts -= 1
+                # Delaying the next try, the delay is doubled with every failed attempt
+                if attempt < attempts - 1:
+                    time.sleep(delay * 2 ** attempt)
 
         # In case the loop exits without the connection being established
-        if self.attempts == 0:
+        if not self.connected:
             raise ConnectionRefusedError("The socket could not connect to {}".format(address))
 
     def receive_until_character(self, character, limit, timeout=None, include=False):
         """
         This method receives data from the wrapped socket until the special 'character' has been received. The limit
         specifies after how many bytes without the termination character a Error should be raised. The timeout
-        is the amount of seconds every individual byte is allowed to take to receive before raising an error. The
+        is the amount of seconds every individual chunk is allowed to take to receive before raising an error. The
         include flag tells whether the termination character should be included in the returned data.
+        The data is received in chunks, the bytes received after the termination character are kept in the receive
+        buffer of the wrapper for the next receive call.
         Args:
             character: can either be an integer in the range between 0 and 255, that is being converted into a
                 character or can be a bytes object/ bytes string of the length 1. After receiving this byte the data
                 up to that point is returned.
             limit: The integer amount of bytes, that can be received without terminating, without raising an error.
-            timeout: The float amount of seconds each individual byte is allowed to take to receive before a
+            timeout: The float amount of seconds each individual chunk is allowed to take to receive before a
                 Timeout is raised.
             include: The boolean flag of whether to include the termination character in the return or not
 
@@ -87,26 +241,30 @@ class SocketWrapper:
         assert (is_bytes and len(character) == 1) or (is_int and 0 <= character <= 255)
         # In case the input is an integer converting it into a bytes object
         if is_int:
-            character = int.to_bytes(character, "1", "big")
-
-        counter = 0
-        # Calling the receive length function with one byte at a time until the character in question appears
-        data = b""
-        while True:
-            # Checking if the limit of bytes has been reched
-            if counter > limit:
-                raise OverflowError("The limit of bytes to receive until character has been reached")
-            current = self.receive_length(1, timeout)
-            if current == character:
-                if include is True:
-                    data += character
-                # After the character has been found and eventually was added to the data, breaking the infinite loop
-                break
-            else:
-                # In case the character is not there adding the byte to the counter and incrementing the counter
-                data += current
-                counter += 1
-        return data
+            character = int.to_bytes(character, 1, "big")
+
+        # Searching the receive buffer for the character and receiving new chunks from the socket until it appears.
+        # Only the newly received part of the buffer has to be searched with each iteration. The methods used within
+        # the loop are bound to local names, to save the attribute lookups
+        buffer = self._rbuf
+        find = buffer.find
+        receive_chunk = self._receive_chunk
+        index = find(character)
+        if index < 0:
+            with socket_timeout(self.sock, timeout):
+                while index < 0:
+                    search_start = len(buffer)
+                    # Checking if the limit of bytes has been reached
+                    if search_start > limit:
+                        raise OverflowError("The limit of bytes to receive until character has been reached")
+                    receive_chunk()
+                    index = find(character, search_start)
+
+        if index > limit:
+            raise OverflowError("The limit of bytes to receive until character has been reached")
+        # Taking the data up to the character from the buffer, the rest stays in the buffer for the next call
+        end = index + 1 if include is True else index
+        return take_front(self._rbuf, end, index + 1)
 
     def receive_line(self, limit, timeout=None):
         """
@@ -132,7 +290,7 @@ class SocketWrapper:
             TimeoutError: In case it took to long to receive the next byte
         Args:
             length: The integer amount of bytes to be received from the socket
-            timeout: The float amount of time, that is tolerated for a byte to be received
+            timeout: The float amount of time, that is tolerated for each recv call of the socket. None for no timeout
 
         Returns:
         The bytes string of the data with the specified length, received from the socket
@@ -142,25 +300,40 @@ class SocketWrapper:
         if not self.connected:
             raise ConnectionError("There is no open connection to receive from yet!")
 
-        start_time = time.time()
-        data = b''
-        while len(data) < length:
-            # receiving more data, while being careful not accidentally receiving too much
-            more = self.sock.recv(length - len(data))
+        # The buffer for the whole data is allocated once and then filled through the memoryview, so that there are
+        # no intermediate bytes objects created for every received piece of data
+        data = bytearray(length)
+        view = memoryview(data)
+
+        # Using the data, that is still left in the receive buffer from a previous call first
+        offset = min(length, len(self._rbuf))
+        with memoryview(self._rbuf) as rbuf_view:
+            view[:offset] = rbuf_view[:offset]
+        del self._rbuf[:offset]
+
+        with socket_timeout(self.sock, timeout):
+            recv_into_view(self.sock, view, offset)
+        return bytes(data)
 
-            # In case there can be no more data received, but the amount of data already received does not match the
-            # amount of data that was specified for the method, raising End of file error
-            if not more:
-                raise EOFError("Only received ({}/{}) bytes".format(len(data), length))
+    def _receive_chunk(self):
+        """
+        This method receives a single chunk of at most 'chunk_size' bytes from the wrapped socket and appends it to
+        the internal receive buffer.
+        Raises:
+            EOFError: In case the data stream has terminated
+            ConnectionError: In case the socket object in question is not connected yet.
+        Returns:
+        void
+        """
+        if not self.connected:
+            raise ConnectionError("There is no open connection to receive from yet!")
 
-            # Checking for overall timeout
-            time_delta = time.time() - start_time
-            if (timeout is not None) and time_delta >= timeout:
-                raise TimeoutError("{} Bytes could not be received in {} seconds".format(length, timeout))
+        chunk = self.sock.recv(self.chunk_size)
+        # In case nothing can be received anymore, the data stream has terminated
+        if not chunk:
+            raise EOFError("The data stream terminated with {} bytes left in the buffer".format(len(self._rbuf)))
 
-            # Adding the newly received data to the stream of already received data
-            data += more
-        return data
+        self._rbuf += chunk
 
     def sendall(self, data):
         """
@@ -184,6 +357,23 @@ class SocketWrapper:
         else:
             raise TypeError("The data to send via socket has to be either string or bytes")
 
+    def sendall_iov(self, buffers):
+        """
+        This method sends all the given buffers over the socket with a single gathering sendmsg call (if possible),
+        which avoids the concatenation of for example a header and a body before sending.
+        Raises:
+            ConnectionError: In case the socket is not connected yet.
+        Args:
+            buffers: The list of bytes like objects to be sent in the given order
+
+        Returns:
+        void
+        """
+        # Checking if the socket is already connected
+        if not self.connected:
+            raise ConnectionError("There is no open connection to send to yet!")
+        sendall_buffers(self.sock, buffers)
+
     def release_socket(self):
         """
         This method releases the socket from the wrapper, by setting the internal property to the socket to None and
@@ -191,11 +381,39 @@ class SocketWrapper:
         Returns:
         The socket, that was used by the wrapper
         """
-        # Removing the pointer to the socket from the object property and returning the socket
+        # Removing the pointer to the socket from the object property and returning the socket. The buffered data
+        # belongs to the released socket and is dropped
         sock = self.sock
         self.sock = None
+        self._rbuf.clear()
         return sock
 
+    def renew_socket(self):
+        """
+        This method closes the wrapped socket and replaces it with a new, unconnected socket of the same family and
+        type, the socket options are applied to the new socket. The data buffered from the old socket is dropped.
+        Returns:
+        void
+        """
+        self.sock.close()
+        self.sock = socket.socket(self.family, self.type)
+        self.apply_socket_options()
+        self._rbuf.clear()
+
+    def apply_socket_options(self):
+        """
+        This method sets the sizes of the kernel receive and send buffers of the wrapped socket and disables the
+        Nagle algorithm in case the socket is a TCP socket.
+        Returns:
+        void
+        """
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.rcvbuf)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.sndbuf)
+        # TCP_NODELAY is only an option for TCP sockets
+        is_inet = self.family in (socket.AF_INET, socket.AF_INET6)
+        if is_inet and self.type == socket.SOCK_STREAM:
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
     def appoint_family(self):
         """
         This method simply sets the family attribute of the object to the same value as the family property of the
@@ -236,7 +454,16 @@ class Connection:
 
     The Connection object is build as something like a bidirectional socket, that implements behaviour for sending
     string data as well as receiving string and bytes data.
+
+    ARGUMENT CHECKS
+    The public methods check the types and values of their arguments with the '_check_*' methods. These checks are
+    only performed if the 'check_arguments' flag is set. By default it is set unless python runs optimized ('-O'),
+    it can also be disabled for a whole Connection class or a single object, once the calling code is known to be
+    correct.
     """
+    # Whether or not the public methods check their arguments
+    check_arguments = __debug__
+
     def __init__(self):
         pass
 
@@ -262,14 +489,26 @@ class Connection:
         """
         raise NotImplementedError()
 
+    def sendall_iov(self, buffers):
+        """
+        A Connection object can send multiple bytes strings in one go. The default implementation simply joins them
+        and sends them as one bytes string, implementations should override this to avoid the concatenation.
+        Args:
+            buffers: The list of bytes string objects to be sent in the given order
+
+        Returns:
+        void
+        """
+        self.sendall_bytes(b''.join(buffers))
+
     def receive_length_string(self, length, timeout):
         """
         A Connection object has to be able to receive only a certain length of string from the communication
         Args:
             length: The amount of characters or the int length of the string supposed to be receuved from the
             connection.
-            timeout: The float amount of time the reception of the string is allowed to take until a Timeout Error
-                is being raised
+            timeout: The float amount of seconds to wait for new data, before a TimeoutError is being raised. This
+                is an idle timeout for every chunk of data, not a limit for the total duration of the reception
 
         Returns:
         The received string
@@ -282,14 +521,29 @@ class Connection:
         Args:
             length: The amount of characters or the int length of the string supposed to be receuved from the
             connection.
-            timeout: The float amount of time the reception of the string is allowed to take until a Timeout Error
-                is being raised
+            timeout: The float amount of seconds to wait for new data, before a TimeoutError is being raised. This
+                is an idle timeout for every chunk of data, not a limit for the total duration of the reception
 
         Returns:
         The received bytes string object
         """
         raise NotImplementedError()
 
+    def receive_into(self, buffer, timeout):
+        """
+        A Connection object can receive data directly into a buffer owned by the caller. The default implementation
+        receives the bytes and copies them into the buffer, implementations should override this to avoid the copy.
+        Args:
+            buffer: A writable bytes like object, which is to be filled completely
+            timeout: The float amount of seconds to wait for new data, before a TimeoutError is being raised. This
+                is an idle timeout for every chunk of data, not a limit for the total duration of the reception
+
+        Returns:
+        void
+        """
+        view = memoryview(buffer).cast("B")
+        view[:] = self.receive_length_bytes(len(view), timeout)
+
     def wait_length_string(self, length):
         """
         The wait method is equal to the equally named receive method except for the fact, that it does not implement a
@@ -320,8 +574,8 @@ class Connection:
         """
         A Connection object has to be able to receive a line from the stream
         Args:
-            timeout: The float amount of time the reception of the string is allowed to take until a Timeout Error
-                is being raised
+            timeout: The float amount of seconds to wait for new data, before a TimeoutError is being raised. This
+                is an idle timeout for every chunk of data, not a limit for the total duration of the reception
         Returns:
         A string up until a new_line character has been received from the connection
         """
@@ -332,10 +586,10 @@ class Connection:
         A Connection object has to be able to receive a string until a special break character has been received
         Args:
             character: The string character with the length one, which is supposed to be received
-            timeout: The float amount of time the reception of the string is allowed to take until a Timeout Error
-                is being raised
+            timeout: The float amount of seconds to wait for new data, before a TimeoutError is being raised. This
+                is an idle timeout for every chunk of data, not a limit for the total duration of the reception
         Raises:
-            TimeoutError: In case the process of receiving exceeds the amount of time specified
+            TimeoutError: In case no new data arrived within the timeout
         Returns:
         A string up until a special line character has been received
         """
@@ -347,8 +601,8 @@ class Connection:
         in the stream
         Args:
             byte: The byte string character after which to return the received sub byte string
-            timeout: The float amount of time the reception of the string is allowed to take until a Timeout Error
-                is being raised
+            timeout: The float amount of seconds to wait for new data, before a TimeoutError is being raised. This
+                is an idle timeout for every chunk of data, not a limit for the total duration of the reception
 
         Returns:
         The received byte string
@@ -379,6 +633,52 @@ class Connection:
         """
         raise NotImplementedError()
 
+    def sendall_frame(self, payload):
+        """
+        A Connection object has to be able to send a frame, which is the bytes payload prefixed with its length, so
+        that the receiving end knows how many bytes to receive without having to search for a break character.
+        Args:
+            payload: The bytes string object to be sent as a frame
+
+        Returns:
+        void
+        """
+        raise NotImplementedError()
+
+    def sendall_frame_iov(self, buffers, prefix=(), suffix=()):
+        """
+        A Connection object can send a frame, whose payload is made up of multiple buffers. The default implementation
+        joins the buffers and sends them as one frame, implementations should override this to avoid the copy.
+        Optionally unframed data can be sent directly in front of and after the frame, implementations should send
+        it together with the frame to avoid separate calls.
+        Args:
+            buffers: A list of bytes like objects, which form the payload of the frame in the given order
+            prefix: A list of bytes like objects to be sent in front of the frame
+            suffix: A list of bytes like objects to be sent after the frame
+
+        Returns:
+        void
+        """
+        if prefix:
+            self.sendall_iov(list(prefix))
+        self.sendall_frame(b''.join(buffers))
+        if suffix:
+            self.sendall_iov(list(suffix))
+
+    def receive_frame(self, timeout, max_size=None):
+        """
+        A Connection object has to be able to receive a frame, that was sent by the 'sendall_frame' method
+        Args:
+            timeout: The float amount of seconds to wait for new data, before a TimeoutError is being raised. This
+                is an idle timeout for every chunk of data, not a limit for the total duration of the reception
+            max_size: The max int length of the payload, that is accepted. None for no limitation
+        Raises:
+            OverflowError: In case the length of the frame exceeds the max size
+        Returns:
+        The received bytes payload of the frame
+        """
+        raise NotImplementedError()
+
     @staticmethod
     def _check_timeout(timeout):
         """
@@ -451,10 +751,39 @@ class SocketConnection(Connection):
     This is a subclass of the Connection object and therefore a direct implementation of its abstract methods. This
     class uses the network communication via socket objects to ensure the receive/send functionlity guaranteed for
     a Connection object.
+
+    RECEIVE BUFFER
+    When receiving until a break character, the data is received from the socket in chunks of the size 'chunk_size'.
+    Everything, that was received after the break character is kept in the receive buffer of the connection and is
+    being consumed first by every following receive call, so that no data is lost by reading to far.
+
+    FRAMES
+    Besides the character delimited data, the connection can send and receive frames. A frame is a bytes payload,
+    which is prefixed with its length, so it can be received with a single receive of the exact length.
+
+    TIMEOUT
+    The timeout of a reception is set as the timeout of the socket for the duration of the call, so it is watched by
+    the kernel within every single recv call and the time does not have to be checked by the receive loops. This
+    makes it an idle timeout: it limits the time waiting for each chunk of data, a reception may take longer in total
+    as long as the data keeps arriving.
+    Because the timeout of the socket is changed by the receptions, a connection (and its socket) must have a single
+    owner thread, which does all the sending and receiving. The commanding handler and client do so, they only hand
+    their connection to a transmitter thread while they wait for it to finish.
     """
+    # The min amount of bytes requested with every single recv call, when filling the receive buffer
+    chunk_size = 4096
+    # The encoding used to turn strings into bytes and back
+    encoding = "utf-8"
+    # The amount of bytes of the header, which contains the length of a frame
+    frame_header_length = 4
+
     def __init__(self, sock):
         Connection.__init__(self)
         self.sock = sock
+        # The buffer for the data, that has already been received from the socket but was not yet consumed
+        self._recv_buf = bytearray()
+        # The already encoded versions of the break characters, so that they do not have to be encoded with every call
+        self._encoded_characters = {"\n": b"\n"}
 
     def sendall_bytes(self, bytes_string):
         """
@@ -476,65 +805,152 @@ class SocketConnection(Connection):
         Returns:
         void
         """
-        self.sendall_bytes(string.encode())
+        self.sendall_bytes(string.encode(self.encoding))
+
+    def sendall_iov(self, buffers):
+        """
+        This method sends the given list of bytes strings over the connection, using the gathering sendmsg of the
+        socket, so that the buffers do not have to be concatenated first
+        Args:
+            buffers: The list of bytes strings to send
+
+        Returns:
+        void
+        """
+        sendall_buffers(self.sock, buffers)
+
+    def sendall_frame(self, payload):
+        """
+        This method sends the given payload as a frame, which means prefixed with a header, that contains the length
+        of the payload as a big endian unsigned integer of 'frame_header_length' bytes.
+        Args:
+            payload: The bytes string to send
+
+        Returns:
+        void
+        """
+        header = len(payload).to_bytes(self.frame_header_length, "big")
+        self.sendall_iov([header, payload])
+
+    def sendall_frame_iov(self, buffers, prefix=(), suffix=()):
+        """
+        This method sends a frame, whose payload is made up of the given buffers. The header contains the total length
+        of the buffers and is sent together with them in one gathering call, the buffers are not joined. The unframed
+        prefix and suffix buffers are part of the same gathering call as well.
+        Args:
+            buffers: A list of bytes like objects, which form the payload of the frame in the given order
+            prefix: A list of bytes like objects to be sent in front of the frame
+            suffix: A list of bytes like objects to be sent after the frame
+
+        Returns:
+        void
+        """
+        length = sum(len(buffer) for buffer in buffers)
+        header = length.to_bytes(self.frame_header_length, "big")
+        self.sendall_iov([*prefix, header, *buffers, *suffix])
+
+    def receive_frame(self, timeout, max_size=None):
+        """
+        This method receives a frame, that was sent by 'sendall_frame'. First the header with the length is received,
+        then exactly that amount of bytes is received as the payload, without having to search for a break character
+        Raises:
+            OverflowError: In case the length of the frame exceeds the max size
+        Args:
+            timeout: The float amount of seconds every single recv call waits for new data. The whole reception
+                may take longer, as long as the data keeps arriving
+            max_size: The max int length of the payload, that is accepted. None for no limitation
+
+        Returns:
+        The received bytes payload of the frame
+        """
+        if self.check_arguments:
+            self._check_timeout(timeout)
+        header = self._receive_exact(self.frame_header_length, timeout)
+        length = int.from_bytes(header, "big")
+        if max_size is not None and length > max_size:
+            raise OverflowError("The frame of {} bytes exceeds the max size of {} bytes".format(length, max_size))
+        # A frame can also have an empty payload
+        if length == 0:
+            return b''
+        return self._receive_exact(length, timeout)
 
     def receive_line(self, timeout):
         """
         This method will receive one line from the connection, which means, the string until a new line character
         occurred.
         Args:
-            timeout: The max amount of time for the reception
+            timeout: The float amount of seconds every single recv call waits for new data. The whole reception
+                may take longer, as long as the data keeps arriving
 
         Returns:
         The received string
         """
-        return self.receive_string_until_character("\n", timeout)
+        if self.check_arguments:
+            self._check_timeout(timeout)
+        bytes_string = self._receive_until(b"\n", timeout)
+        return bytes_string.decode(self.encoding)
 
     def receive_length_string(self, length, timeout):
         """
         This method will receive a specified length of string
         Args:
             length: The int length of the string to receive
-            timeout: The max amount of time for the reception
+            timeout: The float amount of seconds every single recv call waits for new data. The whole reception
+                may take longer, as long as the data keeps arriving
+
+        Returns:
+        The received string
+        """
+        byte_string = self.receive_length_bytes(length, timeout)
+        return byte_string.decode(self.encoding)
+
+    def receive_length_ascii(self, length, timeout):
+        """
+        This method will receive a specified length of string, which is known to only contain ascii characters, for
+        example the digits of a length specification. Decoding ascii is cheaper than the general encoding.
+        Args:
+            length: The int length of the string to receive
+            timeout: The float amount of seconds every single recv call waits for new data. The whole reception
+                may take longer, as long as the data keeps arriving
 
         Returns:
         The received string
         """
         byte_string = self.receive_length_bytes(length, timeout)
-        return byte_string.decode()
+        return byte_string.decode("ascii")
 
     def receive_length_bytes(self, length, timeout):
         """
         This method will receive a specified length of byte string
         Args:
             length: The length of the byte string to receive
-            timeout: The max amount of time for the reception
+            timeout: The float amount of seconds every single recv call waits for new data. The whole reception
+                may take longer, as long as the data keeps arriving
 
         Returns:
         The received byte string
         """
-        self._check_timeout(timeout)
-        self._check_length(length)
-        # Setting up the list wich will contain the data already received
-        data = b''
-        # Setting up the time for the timeout detection
-        start_time = time.time()
-        while len(data) < length:
-
-            received = self.sock.recv(length - len(data))
+        if self.check_arguments:
+            self._check_timeout(timeout)
+            self._check_length(length)
+        return self._receive_exact(length, timeout)
 
-            if not received:
-                raise EOFError("Only received ({}|{}) bytes from the socket".format(len(bytes), bytes))
-
-            # Checking for overall timeout
-            time_delta = time.time() - start_time
-            if time_delta > timeout:
-                raise TimeoutError("{} Bytes could not be received in {} seconds".format(length, timeout))
-
-            data += received
+    def receive_into(self, buffer, timeout):
+        """
+        This method will receive exactly as many bytes as fit into the given buffer and write them into it. Since the
+        buffer is owned by the caller, no new bytes object has to be created for the received data.
+        Args:
+            buffer: A writable bytes like object (bytearray, memoryview...), which is to be filled completely
+            timeout: The float amount of seconds every single recv call waits for new data. The whole reception
+                may take longer, as long as the data keeps arriving
 
-        self.sock.setblocking(True)
-        return data
+        Returns:
+        void
+        """
+        if self.check_arguments:
+            self._check_timeout(timeout)
+        view = memoryview(buffer).cast("B")
+        self._receive_into(view, timeout)
 
     def wait_length_string(self, length):
         """
@@ -546,7 +962,7 @@ class SocketConnection(Connection):
         The received string
         """
         bytes_string = self.wait_length_bytes(length)
-        return bytes_string.decode()
+        return bytes_string.decode(self.encoding)
 
     def wait_length_bytes(self, length):
         """
@@ -557,19 +973,9 @@ class SocketConnection(Connection):
         Returns:
         The received byte string
         """
-        self._check_length(length)
-        # Setting up the list which will contain the data already received
-        data = b''
-        while len(data) < length:
-            received = self.sock.recv(length - len(data))
-
-            # Checking if there is nothing to receive anymore, before the specified amount was reached
-            if not received:
-                raise EOFError("Only received ({}|{}) bytes from the socket".format(len(bytes), bytes))
-
-            data += received
-
-        return data
+        if self.check_arguments:
+            self._check_length(length)
+        return self._receive_exact(length)
 
     def receive_string_until_character(self, character, timeout):
         """
@@ -577,15 +983,19 @@ class SocketConnection(Connection):
         After that the substring, that has been received up until that point will be returned
         Args:
             character: the string break character
-            timeout: The max amount of time for the reception
+            timeout: The float amount of seconds every single recv call waits for new data. The whole reception
+                may take longer, as long as the data keeps arriving
 
         Returns:
         The received string
         """
-        self._check_character(character)
-        byte_character = character.encode()
-        bytes_string = self.receive_bytes_until_byte(byte_character, timeout)
-        return bytes_string.decode()
+        if self.check_arguments:
+            self._check_character(character)
+            self._check_timeout(timeout)
+        # The encoded character does not have to be checked again, so the private method is used directly
+        byte_character = self._encode_character(character)
+        bytes_string = self._receive_until(byte_character, timeout)
+        return bytes_string.decode(self.encoding)
 
     def receive_bytes_until_byte(self, byte, timeout):
         """
@@ -593,37 +1003,17 @@ class SocketConnection(Connection):
         has occurred in the stream
         Args:
             byte: The byte string character after which to return the sub string before
-            timeout: The max time for the reception
+            timeout: The float amount of seconds every single recv call waits for new data. The whole reception
+                may take longer, as long as the data keeps arriving
 
         Returns:
         The received bytes string
         """
         # Raising error in case wrong values have been passed as parameters
-        self._check_byte(byte)
-        self._check_timeout(timeout)
-        # Setting up for the timeout watch
-        start_time = time.time()
-        # The list of byte string data, which is later going to contain the string to return
-        data = []
-        # The temporary string received
-        received = b''
-        while byte != received:
-            received = self.sock.recv(1)
-
-            # Checking if there is nothing to receive anymore, before the specified amount was reached
-            if not received:
-                raise EOFError("Only received ({}|{}) bytes from the socket".format(len(bytes), bytes))
-
-            # Checking for overall timeout
-            time_delta = time.time() - start_time
-            if time_delta > timeout:
-                raise TimeoutError("Bytes could not be received in {} seconds".format(timeout))
-
-            data.append(received)
-        # Removing the break character from the data list
-        data.pop(-1)
-        # Returning the assembled bytes string
-        return b''.join(data)
+        if self.check_arguments:
+            self._check_byte(byte)
+            self._check_timeout(timeout)
+        return self._receive_until(byte, timeout)
 
     def wait_string_until_character(self, character):
         """
@@ -635,10 +1025,12 @@ class SocketConnection(Connection):
         Returns:
         The received string
         """
-        self._check_character(character)
-        byte_character = character.encode()
-        bytes_string = self.wait_bytes_until_byte(byte_character)
-        return bytes_string.decode()
+        if self.check_arguments:
+            self._check_character(character)
+        # The encoded character does not have to be checked again, so the private method is used directly
+        byte_character = self._encode_character(character)
+        bytes_string = self._receive_until(byte_character)
+        return bytes_string.decode(self.encoding)
 
     def wait_bytes_until_byte(self, byte):
         """
@@ -651,21 +1043,153 @@ class SocketConnection(Connection):
         The received byte string
         """
         # Raising error in case wrong values have been passed as parameters
-        self._check_byte(byte)
-        # The list of byte string data, which is later going to contain the string to return
-        data = []
-        # The temporary string received
-        received = b''
-        while byte != received:
-            received = self.sock.recv(1)
+        if self.check_arguments:
+            self._check_byte(byte)
+        return self._receive_until(byte)
+
+    def _encode_character(self, character):
+        """
+        This method returns the encoded version of the given break character. The encoded characters are cached, so
+        that every character is only encoded once per connection.
+        Args:
+            character: The string character to encode
+
+        Returns:
+        The byte string of the character
+        """
+        try:
+            return self._encoded_characters[character]
+        except KeyError:
+            byte_character = character.encode(self.encoding)
+            self._encoded_characters[character] = byte_character
+            return byte_character
+
+    def _receive_exact(self, length, timeout=None):
+        """
+        This method returns exactly the specified amount of bytes. The data is taken from the receive buffer first
+        and only the missing part is received from the socket. That part is received directly into a preallocated
+        buffer, so that there is no over reading into the receive buffer.
+        Raises:
+            EOFError: In case the data stream terminated before the specified amount of bytes was received
+            TimeoutError: In case a recv call did not get any data within the timeout
+        Args:
+            length: The int amount of bytes to return
+            timeout: The float amount of seconds every single recv call waits for new data. None for waiting
+                indefinitely
+
+        Returns:
+        The received byte string
+        """
+        # In case the receive buffer already holds enough data, there is no need to call the socket at all
+        if len(self._recv_buf) >= length:
+            return self._consume(length)
+
+        # Preallocating the buffer, which will contain the data, the socket receives directly into the memoryview
+        data = bytearray(length)
+        self._receive_into(memoryview(data), timeout)
+        return bytes(data)
+
+    def _receive_into(self, view, timeout=None):
+        """
+        This method fills the given memoryview completely. The data is taken from the receive buffer first and the
+        missing part is received from the socket directly into the memoryview.
+        Raises:
+            EOFError: In case the data stream terminated before the memoryview was filled
+            TimeoutError: In case a recv call did not get any data within the timeout
+        Args:
+            view: The writable memoryview of bytes to fill
+            timeout: The float amount of seconds every single recv call waits for new data. None for waiting
+                indefinitely
+
+        Returns:
+        void
+        """
+        length = len(view)
+        # Using the data, that is still left in the receive buffer first
+        offset = min(length, len(self._recv_buf))
+        if offset > 0:
+            with memoryview(self._recv_buf) as buffer_view:
+                view[:offset] = buffer_view[:offset]
+            del self._recv_buf[:offset]
+        if offset == length:
+            return
+
+        # The timeout is watched by the socket itself
+        with socket_timeout(self.sock, timeout):
+            recv_into_view(self.sock, view, offset)
+
+    def _receive_until(self, byte, timeout=None):
+        """
+        This method returns the data up until the given break byte. The receive buffer is filled chunk wise until
+        the break byte is found in it, with every iteration only the newly received part of the buffer is searched.
+        The break byte can also be a multi byte character, in which case the search starts early enough to find it,
+        even if it was split between two chunks.
+        The break byte itself is consumed, but not returned, everything after it stays in the receive buffer.
+        Raises:
+            EOFError: In case the data stream terminated before the break byte was received
+            TimeoutError: In case a recv call did not get any data within the timeout
+        Args:
+            byte: The byte string character after which to return the sub string before
+            timeout: The float amount of seconds every single recv call waits for new data. None for waiting
+                indefinitely
+
+        Returns:
+        The received byte string
+        """
+        # Binding the methods used in the loop to local names, to save the attribute lookups with every iteration
+        buffer = self._recv_buf
+        find = buffer.find
+        fill = self._fill
+        overlap = len(byte) - 1
+        index = find(byte)
+        # The socket only has to be called in case the break byte is not already in the buffer, the timeout is being
+        # watched by the socket itself
+        if index < 0:
+            with socket_timeout(self.sock, timeout):
+                while index < 0:
+                    filled = len(buffer)
+                    fill(filled + 1)
+                    index = find(byte, max(0, filled - overlap))
+
+        # Copying the data up to the break byte and then removing it together with the break byte from the buffer
+        # in a single deletion
+        return take_front(buffer, index, index + len(byte))
+
+    def _fill(self, min_bytes):
+        """
+        This method receives data from the socket into the receive buffer, until the buffer contains at least the
+        given amount of bytes. Every recv call requests at least 'chunk_size' bytes, so the buffer may contain more
+        data afterwards.
+        Raises:
+            EOFError: In case the data stream terminated before the buffer was filled
+        Args:
+            min_bytes: The int amount of bytes the buffer has to contain at least
+
+        Returns:
+        void
+        """
+        # Binding the objects used in the loop to local names and keeping track of the buffer length manually
+        buffer = self._recv_buf
+        recv = self.sock.recv
+        chunk_size = self.chunk_size
+        filled = len(buffer)
+        while filled < min_bytes:
+            received = recv(max(chunk_size, min_bytes - filled))
 
             # Checking if there is nothing to receive anymore, before the specified amount was reached
             if not received:
-                raise EOFError("Only received ({}|{}) bytes from the socket".format(len(bytes), bytes))
+                raise EOFError("Only received ({}|{}) bytes from the socket".format(filled, min_bytes))
+
+            buffer += received
+            filled += len(received)
 
-            data.append(received)
-        # Removing the break character from the data list
-        data.pop(-1)
-        # Returning the assembled bytes string
-        return b''.join(data)
+    def _consume(self, length):
+        """
+        This method removes the given amount of bytes from the front of the receive buffer and returns them.
+        Args:
+            length: The int amount of bytes to take from the buffer
 
+        Returns:
+        The byte string taken from the buffer
+        """
+        return take_front(self._recv_buf, length)
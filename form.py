@@ -1,11 +1,64 @@
 import threading
 import pickle
-import time
 import json
+import re
+import struct
+
+# orjson is an optional dependency, which encodes objects directly into json bytes in a single pass. In case it is not
+# installed, the json module of the standard library is used by the JsonAppendixEncoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# simdjson is an optional dependency, which parses json with SIMD instructions. It is used for decoding in case orjson
+# is not installed. A simdjson parser must not be used by multiple threads at once, thus every thread gets its own
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+_simdjson_local = threading.local()
+
+# msgpack is an optional dependency, which is needed for the binary MsgpackAppendixEncoder
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# ijson is an optional dependency, which parses json incrementally from a stream. In case it is installed, big json
+# appendices can be decoded while they are still being received, instead of after the complete payload has arrived
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# numpy is an optional dependency. In case it is installed, a one dimensional array can be passed as the body of a form,
+# its items are converted into the lines of the body within numpy, instead of one str call per item
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# The encoder used in case orjson is not available or cannot encode an object. Like orjson it leaves out the
+# whitespaces after the separators, which makes the encoded appendix smaller. The instance is created once, because
+# passing the separators to json.dumps would create a new encoder with every call
+_json_encoder = json.JSONEncoder(separators=(",", ":"))
+
+# orjson decodes integers, which do not fit into 64 bit, as floats. Those integers have at least 20 digits, so a json
+# containing a number with that many digits is decoded by the json module instead. The search is done by the regex
+# engine in C and is a lot cheaper than the decoding itself
+_long_number_pattern = re.compile(rb"[0-9]{20}")
+
+# The scalar types, which are json serializable and can be pickled without attempting to encode them. Containers are
+# not walked in python, since that is slower than simply encoding them
+JSON_PRIMITIVE_TYPES = (str, int, float, bool, type(None))
 
 
 # THE FORM TRANSMISSION PROTOCOL
 
+# The acknowledgement, that the receiving end sends after every part of a form. It is the single ASCII ACK control byte
+ACK = b"\x06"
+
 class AppendixEncoder:
     """
     INTERFACE
@@ -35,6 +88,38 @@ class AppendixEncoder:
         """
         raise NotImplementedError("This method has to be overwritten")
 
+    @classmethod
+    def encode_buffers(cls, obj):
+        """
+        This method returns the encoded object as a list of bytes like buffers, which joined together are the byte
+        string returned by 'encode'. This way big buffers can be transmitted as they are, without copying them into
+        one byte string first. On default the list only contains the result of 'encode', encoders, which can
+        produce separate buffers are supposed to overwrite this.
+        Args:
+            obj: Any type of object, that can be encoded by the chosen method
+
+        Returns:
+        The list of bytes like objects
+        """
+        return [cls.encode(obj)]
+
+    @classmethod
+    def encode_into(cls, obj, writer):
+        """
+        This method encodes the given object and writes the encoded bytes into the given binary file like object,
+        for example a file opened with 'wb', a BytesIO or the file of a socket. On default the object is encoded with
+        'encode' and then written, encoders, which can write the encoded object piece by piece are supposed to
+        overwrite this, so that the whole byte string does not have to be held in memory.
+        Args:
+            obj: Any type of object, that can be encoded by the chosen method
+            writer: The binary file like object with a 'write' method
+
+        Returns:
+        void
+        """
+        for buffer in cls.encode_buffers(obj):
+            writer.write(buffer)
+
     @staticmethod
     def decode(byte_string):
         """
@@ -48,6 +133,21 @@ class AppendixEncoder:
         """
         raise NotImplementedError("This method has to be overwritten!")
 
+    @classmethod
+    def decode_stream(cls, read, length):
+        """
+        This method takes a function to read bytes from a stream and the length of the encoded object on the stream
+        and returns the decoded object. On default the whole byte string is being read and then decoded, encoders,
+        which can decode incrementally are supposed to overwrite this.
+        Args:
+            read: The function with the int amount of bytes to read as parameter, which returns at most that many bytes
+            length: The int amount of bytes, that make up the encoded object
+
+        Returns:
+        Any kind of object, that was subject to the encoding process
+        """
+        return cls.decode(StreamReader(read, length).read())
+
     @staticmethod
     def is_serializable(obj):
         """
@@ -72,10 +172,18 @@ class JsonAppendixEncoder(AppendixEncoder):
         Args:
             obj: Any kind of object, that is naturally json serializable, which is most of the python native iterables
 
+        Notes:
+            In case orjson is installed it is being used, since it creates the bytes directly without the intermediate
+            string. Objects orjson cannot encode exactly (integers bigger than 64 bit, NaN and infinite floats) are
+            still encoded with the json module, so the encoded appendix does not depend on orjson being installed.
         Returns:
         The byte string representation of the object
         """
-        json_string = json.dumps(obj)
+        if orjson is not None:
+            byte_string = JsonAppendixEncoder._orjson_encode(obj)
+            if byte_string is not None:
+                return byte_string
+        json_string = _json_encoder.encode(obj)
         byte_string = json_string.encode()
         return byte_string
 
@@ -85,15 +193,32 @@ class JsonAppendixEncoder(AppendixEncoder):
         Thus method will use the json loads functionality to turn the byte string object given back into a string using
         the regular utf 8 decoding and then attempting to json load the original object from that string.
         Notes:
-            In case the byte string obe
+            In case the byte string is empty or only whitespaces, an empty list is returned.
+            Besides bytes any bytes like object can be decoded, for example a memoryview of a receive buffer.
+            The fastest available parser is used: orjson if installed, otherwise simdjson and the json module as the
+            fallback for anything they reject. A json, which contains integers bigger than 64 bit, NaN or infinite
+            floats is always decoded by the json module, so that these values are decoded exactly.
         Args:
             byte_string: The bytes object, that was originally a object encoded with json
 
         Returns:
         The object, stored as the byte string
         """
+        if orjson is not None:
+            # orjson rejects NaN and Infinity with a ValueError, but it would decode big integers as floats
+            if _long_number_pattern.search(byte_string) is None:
+                try:
+                    return orjson.loads(byte_string)
+                except ValueError:
+                    pass
+        elif simdjson is not None:
+            # simdjson rejects integers bigger than 64 bit with a RuntimeError, the json module can decode those
+            try:
+                return JsonAppendixEncoder._simdjson_parser().parse(bytes(byte_string), recursive=True)
+            except (ValueError, RuntimeError):
+                pass
         # Turning the bytes back into the json string first
-        json_string = byte_string.decode()
+        json_string = str(byte_string, "utf-8")
         # Adding the special case for an empty string
         if len(json_string.strip()) == 0:
             return []
@@ -101,16 +226,107 @@ class JsonAppendixEncoder(AppendixEncoder):
         obj = json.loads(json_string)
         return obj
 
+    @classmethod
+    def encode_into(cls, obj, writer):
+        """
+        This method writes the json of the given object into the binary file like object. With orjson the object is
+        encoded in one go. Otherwise the json module encodes the object piece by piece and every piece is written
+        right away, so that the complete json string is never held in memory.
+        Notes:
+            The json module is a lot slower, when it encodes piece by piece, thus this only pays off for appendices,
+            that are big compared to the available memory.
+        Args:
+            obj: Any kind of object, that is naturally json serializable
+            writer: The binary file like object with a 'write' method
+
+        Returns:
+        void
+        """
+        if orjson is not None:
+            byte_string = cls._orjson_encode(obj)
+            if byte_string is not None:
+                writer.write(byte_string)
+                return
+        for chunk in _json_encoder.iterencode(obj):
+            writer.write(chunk.encode())
+
+    @classmethod
+    def decode_stream(cls, read, length):
+        """
+        This method decodes a json object, that is read from a stream. In case ijson is installed, the json is being
+        parsed incrementally from the chunks read, so that the decoding happens while the data is still arriving and
+        the whole byte string never has to be held in memory.
+        Notes:
+            Without ijson the whole byte string is read first and then decoded with the 'decode' method.
+            The given length is always read completely from the stream, even if the json object ends before.
+        Raises:
+            ValueError: In case the bytes are not a single json object, possibly surrounded by whitespaces
+        Args:
+            read: The function with the int amount of bytes to read as parameter, which returns at most that many bytes
+            length: The int amount of bytes, that make up the json object on the stream
+
+        Returns:
+        The decoded object
+        """
+        reader = StreamReader(read, length)
+        if ijson is None or length == 0:
+            return cls.decode(reader.read())
+        # The prefix of the top level object is the empty string. Without floats ijson would return Decimal objects
+        items = ijson.items(reader, "", use_float=True)
+        try:
+            obj = next(items, [])
+            # Exhausting the items makes ijson parse up to the end of the stream, which rejects any trailing data
+            for _ in items:
+                raise ValueError("The stream contains more than one json object")
+        except ijson.JSONError as error:
+            raise ValueError(str(error)) from error
+        # Whatever ijson did not read has to be consumed as well, otherwise it would be left on the connection
+        if len(reader.read().strip()) != 0:
+            raise ValueError("The stream contains data after the json object")
+        return obj
+
+    @staticmethod
+    def _orjson_encode(obj):
+        """
+        This method encodes the object with orjson, in case orjson encodes it exactly like the json module would
+        Returns:
+        The bytes of the encoded object or None, in case the json module has to be used
+        """
+        try:
+            byte_string = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return None
+        # orjson encodes NaN and infinite floats as null, only a json without any null can not contain them
+        if b"null" in byte_string:
+            return None
+        return byte_string
+
+    @staticmethod
+    def _simdjson_parser():
+        """
+        This method returns the simdjson parser of the current thread, creating it with the first call
+        Returns:
+        The simdjson Parser object
+        """
+        try:
+            return _simdjson_local.parser
+        except AttributeError:
+            _simdjson_local.parser = simdjson.Parser()
+            return _simdjson_local.parser
+
     @staticmethod
     def is_serializable(obj):
         """
-        Returns whether the passed object can be json serialized or not
+        Returns whether the passed object can be json serialized or not. Scalars of the json primitive types are
+        recognized by their type, all other objects are attempted to be encoded
         Args:
             obj: The object in question
 
         Returns:
         the boolean value
         """
+        if isinstance(obj, JSON_PRIMITIVE_TYPES):
+            return True
         try:
             JsonAppendixEncoder.encode(obj)
             return True
@@ -128,44 +344,112 @@ class PickleAppendixEncoder(AppendixEncoder):
     means that the encoding iss limited to a communication between two members operating python.
 
     Because the class is using pickle, the encoded data is non readable and on default of the bytes data type
+
+    OUT OF BAND BUFFERS
+    Objects, which support the out of band buffers of the pickle protocol 5 (PickleBuffer objects or numpy arrays for
+    example) are not copied into the pickle data. Their buffers are appended to the pickle data as they are, followed
+    by a trailer with the lengths of the buffers, the amount of buffers and the 'OUT_OF_BAND_MARKER'. Pickle data
+    itself always ends with the STOP opcode, so a byte string without the marker is decoded as plain pickle data.
     """
+    # The last bytes of an encoded object with out of band buffers
+    OUT_OF_BAND_MARKER = b"OOB5"
+
     @staticmethod
     def encode(obj):
         """
         This method uses the python native pickle dumps functionality to directly turn the given object into a byte
-        string
+        string. The highest protocol available is used, as its binary opcodes are the fastest to dump and load.
         Args:
             obj: The object to convert
 
         Returns:
         The pickled byte string
         """
-        byte_string = pickle.dumps(obj)
-        return byte_string
+        return b''.join(PickleAppendixEncoder.encode_buffers(obj))
 
-    @staticmethod
-    def decode(byte_string):
+    @classmethod
+    def encode_buffers(cls, obj):
+        """
+        This method pickles the given object and returns the list of the pickle data, the out of band buffers and
+        the trailer describing them. The out of band buffers are not copied. In case there are no out of band buffers,
+        the list only contains the plain pickle data.
+        Args:
+            obj: The object to convert
+
+        Returns:
+        The list of bytes like objects
+        """
+        buffers = []
+        data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL, buffer_callback=buffers.append)
+        if len(buffers) == 0:
+            return [data]
+
+        views = [buffer.raw() for buffer in buffers]
+        lengths = [len(view) for view in views]
+        trailer = struct.pack(">{}QI".format(len(lengths)), *lengths, len(lengths)) + cls.OUT_OF_BAND_MARKER
+        return [data] + views + [trailer]
+
+    @classmethod
+    def encode_into(cls, obj, writer):
         """
-        This method calls the pickle loads on the given byte string to load the encoded object
+        This method pickles the given object directly into the binary file like object. Pickle writes the data in
+        frames while it goes, thus the complete pickle byte string is never held in memory.
+        Notes:
+            The out of band buffers are not used here, all the buffers are written as part of the pickle data, which
+            can be decoded just like the result of 'encode'.
         Args:
-            byte_string: The byte string representation of the encoded object
+            obj: The object to convert
+            writer: The binary file like object with a 'write' method
+
+        Returns:
+        void
+        """
+        pickle.dump(obj, writer, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def decode(cls, byte_string):
+        """
+        This method calls the pickle loads on the given byte string to load the encoded object. The out of band
+        buffers are passed to pickle as memoryviews of the byte string, so they are not copied.
+        Args:
+            byte_string: The byte string representation of the encoded object. Can also be any other bytes like
+                object, for example a memoryview of a receive buffer
 
         Returns:
         The original object
         """
-        obj = pickle.loads(byte_string)
+        view = memoryview(byte_string).cast("B")
+        marker_length = len(cls.OUT_OF_BAND_MARKER)
+        if len(view) < marker_length + 4 or view[-marker_length:] != cls.OUT_OF_BAND_MARKER:
+            return pickle.loads(view)
+
+        # Reading the trailer from the back: the amount of buffers and then the lengths of all the buffers
+        end = len(view) - marker_length - 4
+        count, = struct.unpack(">I", view[end:end + 4])
+        end -= 8 * count
+        lengths = struct.unpack(">{}Q".format(count), view[end:end + 8 * count])
+        # The buffers are located directly in front of the trailer
+        buffers = []
+        for length in reversed(lengths):
+            buffers.append(view[end - length:end])
+            end -= length
+        buffers.reverse()
+        obj = pickle.loads(view[:end], buffers=buffers)
         return obj
 
     @staticmethod
     def is_serializable(obj):
         """
-        This method returns whether or not the object passed can be serialized by pickle
+        This method returns whether or not the object passed can be serialized by pickle. Scalars of the json
+        primitive types can always be pickled, all other objects are attempted to be encoded
         Args:
             obj: The object in question
 
         Returns:
         boolean value
         """
+        if isinstance(obj, JSON_PRIMITIVE_TYPES):
+            return True
         try:
             PickleAppendixEncoder.encode(obj)
             return True
@@ -173,6 +457,122 @@ class PickleAppendixEncoder(AppendixEncoder):
             return False
 
 
+class MsgpackAppendixEncoder(AppendixEncoder):
+    """
+    STATIC CLASS
+    This is a subclass of the appendix encoder interface, which encodes the appendix with the binary MessagePack
+    format. Compared to json there is no text formatting and parsing involved, which makes the encoding and decoding
+    faster and the encoded appendix smaller. Just like json it is language independent and supports the python
+    native data structures, but unlike json the keys of dicts can also be integers and bytes are supported natively.
+
+    Notes:
+        This encoder needs the optional msgpack package, without it encoding raises an ImportError.
+        Since the appendix encoder is not transmitted with the form, both ends of a transmission have to use it.
+    """
+    @staticmethod
+    def encode(obj):
+        """
+        This method packs the given object into the MessagePack byte string
+        Raises:
+            ImportError: In case msgpack is not installed
+        Args:
+            obj: The object to encode
+
+        Returns:
+        The byte string representation of the object
+        """
+        if msgpack is None:
+            raise ImportError("The MsgpackAppendixEncoder needs the msgpack package to be installed")
+        return msgpack.packb(obj, use_bin_type=True)
+
+    @staticmethod
+    def decode(byte_string):
+        """
+        This method unpacks the object from the given MessagePack byte string. Any bytes like object can be decoded
+        Notes:
+            In case the byte string is empty, an empty list is returned.
+        Args:
+            byte_string: The byte string, that was originally a object encoded with MessagePack
+
+        Returns:
+        The original object
+        """
+        if len(byte_string) == 0:
+            return []
+        if msgpack is None:
+            raise ImportError("The MsgpackAppendixEncoder needs the msgpack package to be installed")
+        return msgpack.unpackb(byte_string, raw=False, strict_map_key=False)
+
+    @staticmethod
+    def is_serializable(obj):
+        """
+        This method returns whether or not the object passed can be serialized by msgpack
+        Args:
+            obj: The object in question
+
+        Returns:
+        boolean value
+        """
+        try:
+            MsgpackAppendixEncoder.encode(obj)
+            return True
+        except:
+            return False
+
+
+class StreamReader:
+    """
+    This is a file like wrapper around a function, which reads bytes from a stream. The reader returns at most the
+    specified length of bytes in total, so that parsers reading from it in chunks will not read beyond the encoded
+    object and into the data, that follows it on the stream.
+    """
+    def __init__(self, read, length):
+        self.read_function = read
+        self.remaining = length
+
+    def read(self, size=-1):
+        """
+        Reads at most size bytes from the stream, a negative size reads all the remaining bytes
+        Raises:
+            EOFError: In case the stream ended, before all the bytes of the encoded object were read
+        Args:
+            size: The int max amount of bytes to read
+
+        Returns:
+        The bytes read, an empty bytes object in case all the bytes have been read
+        """
+        read_all = size < 0
+        if read_all or size > self.remaining:
+            size = self.remaining
+        if size == 0:
+            return b''
+        data = self._read_chunk(size)
+        # The read function might return less than requested, reading all has to call it until nothing remains
+        if read_all and self.remaining > 0:
+            chunks = [data]
+            while self.remaining > 0:
+                chunks.append(self._read_chunk(self.remaining))
+            data = b''.join(chunks)
+        return data
+
+    def _read_chunk(self, size):
+        """
+        Calls the read function a single time with the given size
+        Raises:
+            EOFError: In case the read function returned no data
+        Args:
+            size: The int max amount of bytes to read, must not be more than the remaining amount
+
+        Returns:
+        The bytes returned by the read function
+        """
+        data = self.read_function(size)
+        if not data:
+            raise EOFError("The stream ended {} bytes before the end of the encoded object".format(self.remaining))
+        self.remaining -= len(data)
+        return data
+
+
 class FormFrame:
 
     def __init__(self, title, body, appendix):
@@ -233,14 +633,24 @@ class Form:
     Attributes:
         title: The string title of the Form
         body: The string block, organized by new line characters
-        appendix_json: The Json string of the data to be represented by the appendix
+        appendix_encoded: The encoded bytes of the appendix, which are joined from the buffers of the encoder with the
+            first access and then kept until a new appendix is assigned
         appendix: The actual data object, described by the json string
+        appendix_length: The int length of the encoded appendix
     """
+    # Forms are created in great numbers, without the instance dict they need less memory and the attribute access is
+    # a bit faster. Subclasses, that do not define slots themselves, still get a dict for their own attributes
+    __slots__ = ("title", "body", "_appendix", "_appendix_encoded", "appendix_buffers", "appendix_length",
+                 "appendix_encoder")
+
     def __init__(self, title, body, appendix, appendix_encoder=JsonAppendixEncoder):
         self.title = title
         self.body = body
-        self.appendix = appendix
+        # The appendix is assigned to the private attribute, as the property setter would already encode it
+        self._appendix = appendix
         self.appendix_encoded = None
+        self.appendix_buffers = None
+        self.appendix_length = None
         self.appendix_encoder = appendix_encoder
 
         # Checking if the title is a string without a new line, as needed
@@ -250,27 +660,90 @@ class Form:
         # Json the appendix in case it is raw data, attempting to load in case it is a string
         self.evaluate_appendix()
 
+    @classmethod
+    def from_trusted(cls, title, body, appendix_encoded, appendix_encoder=JsonAppendixEncoder):
+        """
+        This method creates a Form object from values, which are known to be correct already, like the ones received
+        by the FormReceiverThread. None of the checks and conversions of the constructor are done, the title and
+        body are assigned as they are and the appendix is only decoded.
+        Args:
+            title: The single line string title of the form
+            body: The body string
+            appendix_encoded: The bytes of the encoded appendix. Can also be any other bytes like object, for example
+                the buffer the appendix was received into, it is then only copied into bytes, once 'appendix_encoded'
+                is accessed
+            appendix_encoder: The AppendixEncoder class to decode the appendix with
+
+        Returns:
+        The Form object
+        """
+        form = cls.__new__(cls)
+        form.title = title
+        form.body = body
+        form.appendix_encoder = appendix_encoder
+        form.appendix_buffers = [appendix_encoded]
+        form._appendix_encoded = appendix_encoded if isinstance(appendix_encoded, bytes) else None
+        form.appendix_length = len(appendix_encoded)
+        form._appendix = appendix_encoder.decode(appendix_encoded)
+        return form
+
+    @classmethod
+    def from_decoded(cls, title, body, appendix, appendix_buffers, appendix_encoder=JsonAppendixEncoder):
+        """
+        This method creates a Form object from values, which are known to be correct already, just like
+        'from_trusted', but for an appendix, which has already been decoded, for example while it was being received.
+        Args:
+            title: The single line string title of the form
+            body: The body string
+            appendix: The decoded appendix object
+            appendix_buffers: The list of bytes like objects, which joined together are the encoded appendix
+            appendix_encoder: The AppendixEncoder class, which the appendix was decoded with
+
+        Returns:
+        The Form object
+        """
+        form = cls.__new__(cls)
+        form.title = title
+        form.body = body
+        form.appendix_encoder = appendix_encoder
+        form.appendix_buffers = appendix_buffers
+        form._appendix_encoded = None
+        form.appendix_length = sum(len(buffer) for buffer in appendix_buffers)
+        form._appendix = appendix
+        return form
+
     def evaluate_body(self):
         """
         The body parameter can either be a string or a list of items (which have to be able to be turned into strings),
         but the objects needs the body property to be a string. Thus this method checks for the requirements of type
         etc. to match and turns the list into a string with newline seperation of the characters.
+        In case numpy is installed, the body can also be a one dimensional numpy array.
         Raises:
             TypeError: In case the body attribute is neither string nor list
             ValueError: In case the items of the list cannot be turned into a string
         Returns:
         None
         """
-        # Checking the body attribute for the requirements
-        self.check_body()
+        # The body being a string would be the most common case
+        if isinstance(self.body, str):
+            return
+        if numpy is not None and isinstance(self.body, numpy.ndarray):
+            if self.body.ndim != 1:
+                raise ValueError("Only a one dimensional array can be used as the body")
+            # The items are converted into strings by numpy, only the joining is left
+            self.body = '\n'.join(self.body.astype(str).tolist())
+            return
         if isinstance(self.body, list):
-            # Since the body attribute has been checked, it is safe to assume every item can be converted into string
-            body_string_map = map(str, self.body)
-            body_string_list = list(body_string_map)
-            # Producing a string, that separates the strings in this list by a newline character
-            body_string = '\n'.join(body_string_list)
-            # Setting the body to be the assembled
-            self.body = body_string
+            # Every item is converted into a string only once. Checking the list with 'check_body' first would convert
+            # every item twice, a failing conversion raises the same error as the check would
+            # Producing a string, that separates the strings in this list by a newline character. The map is joined
+            # directly, without building an intermediate list of the strings first
+            try:
+                self.body = '\n'.join(map(str, self.body))
+            except ValueError:
+                raise TypeError("The list for the body must only contain items, that can be strings")
+        else:
+            raise ValueError("The body attribute must either be a string or a list os strings")
 
     def evaluate_appendix(self):
         """
@@ -281,23 +754,71 @@ class Form:
         Returns:
         void
         """
-        # In case the appendix is a string it is being interpreted as already in json format and thus trying to unjson
-        if isinstance(self.appendix, bytes):
-            try:
-                # Attempting to use the encoder to encoder to decode the bytes string
-                self.appendix_encoded = self.appendix
-                appendix_decoded = self.appendix_encoder.decode(self.appendix_encoded)
-                self.appendix = appendix_decoded
-            except ValueError as value_error:
-                raise value_error
-            except TypeError as type_error:
-                raise type_error
-        # All other data types are interpreted as raw data and are being jsoned
+        # In case the appendix is a string it is being interpreted as already in json format and thus trying to unjson.
+        # A malformed byte string is rejected by the decoder itself with a ValueError, it is not checked beforehand
+        if isinstance(self._appendix, bytes):
+            self.appendix_encoded = self._appendix
+            self._appendix = self.appendix_encoder.decode(self.appendix_encoded)
+        # All other data types are interpreted as raw data and are being jsoned. The encoded appendix is kept as the
+        # list of buffers, the encoder returned, those are only joined once the byte string is actually needed
         else:
-            try:
-                self.appendix_encoded = self.appendix_encoder.encode(self.appendix)
-            except ValueError as e:
-                raise e
+            self.appendix_buffers = self.appendix_encoder.encode_buffers(self._appendix)
+            # The joined bytes of a previous appendix must not be returned anymore
+            self._appendix_encoded = None
+        # The length of the encoded appendix is needed for the separation line of every transmission
+        self.appendix_length = sum(len(buffer) for buffer in self.appendix_buffers)
+
+    @property
+    def appendix(self):
+        """
+        This property returns the appendix object of the form
+        Returns:
+        The appendix object
+        """
+        return self._appendix
+
+    @appendix.setter
+    def appendix(self, value):
+        """
+        This method sets a new appendix for the form. Just like with the constructor, the appendix can be the object
+        or its encoded bytes. The encoded appendix, which is kept by the form, is replaced right away, so it never
+        belongs to a previous appendix.
+        Args:
+            value: The appendix object or its encoded bytes
+
+        Returns:
+        void
+        """
+        self._appendix = value
+        self.evaluate_appendix()
+
+    @property
+    def appendix_encoded(self):
+        """
+        This property returns the encoded appendix as one byte string. In case the encoder returned the appendix as
+        multiple buffers, they are joined with the first access
+        Returns:
+        The bytes of the encoded appendix
+        """
+        if self._appendix_encoded is None and self.appendix_buffers is not None:
+            if len(self.appendix_buffers) == 1:
+                self._appendix_encoded = bytes(self.appendix_buffers[0])
+            else:
+                self._appendix_encoded = b''.join(self.appendix_buffers)
+        return self._appendix_encoded
+
+    @appendix_encoded.setter
+    def appendix_encoded(self, value):
+        """
+        This method sets the encoded appendix byte string, which then also is the only buffer of the appendix
+        Args:
+            value: The bytes of the encoded appendix
+
+        Returns:
+        void
+        """
+        self._appendix_encoded = value
+        self.appendix_buffers = None if value is None else [value]
 
     @property
     def empty(self):
@@ -317,9 +838,8 @@ class Form:
         Returns:
         The boolean value of whether or not the form is valid
         """
-        # stripped refers to as being stripped of all its whitespaces
-        stripped_title = self.title.replace(" ", "")
-        if len(stripped_title) == 0:
+        # A title of only whitespaces (including tabs) is empty as well, checking that does not create a new string
+        if len(self.title) == 0 or self.title.isspace():
             return False
         elif self.empty:
             return False
@@ -449,20 +969,29 @@ class Form:
         """
         The magic method for comparing two form objects. Two form objects are equal if the title, the body and the
         appendix are equal
+        Notes:
+            The comparisons are ordered from cheap to expensive and the method returns as soon as the result is known.
+            In case both appendices were encoded by the same encoder into the same bytes, they are equal without
+            comparing the appendix objects. Different bytes do not mean different objects though (the order of the
+            keys of a dict for example), in that case the objects are compared.
         Args:
             other: The other Form object to test
 
         Returns:
         boolean value of whether or not they are equal
         """
-        if isinstance(other, Form):
-            same_title = other.title == self.title
-            # List comprehension, where the order is irrelevant
-            same_body = sorted(other.body_list) == sorted(self.body_list)
-            same_appendix = other.appendix == self.appendix
-            if same_title and same_body and same_appendix:
-                return True
-        return False
+        if not isinstance(other, Form):
+            return False
+        if other.title != self.title:
+            return False
+        # List comprehension, where the order is irrelevant. Identical body strings do not have to be sorted though
+        if other.body != self.body and sorted(other.body_list) != sorted(self.body_list):
+            return False
+        same_encoder = other.appendix_encoder is self.appendix_encoder
+        if same_encoder and other.appendix_length == self.appendix_length and \
+                other.appendix_encoded == self.appendix_encoded:
+            return True
+        return other.appendix == self.appendix
 
     def __str__(self):
         """
@@ -479,26 +1008,51 @@ class Form:
         return '\n'.join(string_list)
 
 
+# The compiled patterns, which match the separation strings at the start of a line, by their separation string
+_separation_patterns = {}
+
+
+def separation_pattern(separation):
+    """
+    This function returns the compiled regex pattern, which matches the given separation string at the start of any
+    line of a body string. The patterns are cached, so every separation string is only compiled once.
+    Args:
+        separation: The separation string
+
+    Returns:
+    The compiled re pattern object
+    """
+    try:
+        return _separation_patterns[separation]
+    except KeyError:
+        pattern = re.compile("^" + re.escape(separation), re.MULTILINE)
+        _separation_patterns[separation] = pattern
+        return pattern
+
+
 class FormTransmitterThread(threading.Thread):
     """
     GENERAL
     This is a Thread. The Thread is supposed to be passed a socket, which has an already open connection to a Thread
     on the other side, which receives the Form data as a counterpart to this one. This Thread is used to transmit a
-    Form object. The title of the form is being sent first and after that the individual lines of the forms string
-    body are being transmitted before the separation (a special string, that can also be specified) is being sent with
-    the length of the string of the forms appendix.
-    In between each sending the receiving end is supposed to be sending an ACK message. In case the ACK is not sent in
-    the specified amount of time for the timeout the communication is stopped.
+    Form object. The title of the form is being sent first and after that the forms string body is being transmitted
+    as a single length prefixed frame, whose last line is the separation (a special string, that can also be
+    specified) with the length of the string of the forms appendix.
+    The receiving end is supposed to be sending an ACK message after each of these parts. The parts are all sent at
+    once though and the three ACK messages are expected afterwards. In case an ACK is not sent in the specified amount
+    of time for the timeout the communication is stopped.
 
     SEPARATION COLLISIONS:
     The separation string is supposed to be a definite sign, that the body of the form is now finished and that the
-    appendix starts now. In case the separation string is already the front part of a line in the body of the form
-    that would lead to an error. Through the 'adjust' parameter it can be set, that the body is being searched for
-    ocurrances of the separation string and then adjusted, so that they would not be recognised, by adding a whitespace
-    at the front of the line. In case the adjust is False, the body will be searched for the separation string and
-    an exception risen in case one was found
+    appendix starts now. Since the body is sent as a frame, whose last line is the separation line, the receiving end
+    does not search the body for the separation string and lines of the body starting with the separation string do
+    not collide with it. Thus the body is sent as it is on default (adjust None).
+    Through the 'adjust' parameter it can still be set, that the body is being searched for ocurrances of the
+    separation string and then adjusted, so that they would not be recognised, by adding a whitespace at the front of
+    the line. In case the adjust is False, the body will be searched for the separation string and an exception risen
+    in case one was found
     """
-    def __init__(self, connection, form, separation, timeout=10, adjust=True):
+    def __init__(self, connection, form, separation, timeout=10, adjust=None):
         threading.Thread.__init__(self)
         # The form object to be transmitted over the socket connection
         self.form = form
@@ -509,13 +1063,15 @@ class FormTransmitterThread(threading.Thread):
         self.separation = separation
         self.check_separation()
 
-        if adjust:
+        # The body only has to be searched for the separation string, if explicitly requested
+        if adjust is True:
             self.adjust_body_string()
-        else:
+        elif adjust is False:
             self.check_body_string()
 
         # The timeout of receiving the ack after a sending
         self.timeout = timeout
+        self.ack_buffer = bytearray(len(ACK))
         self.exception = None
         # The state variables of the Thread and the transmission
         self.running = False
@@ -524,11 +1080,11 @@ class FormTransmitterThread(threading.Thread):
     def run(self):
         try:
             self.running = True
-            self.send_title()
+            # The receiving end reads the title, body and appendix in order, without waiting for anything in between,
+            # so all of them are sent at once and the three acks are collected afterwards
+            self.send_form()
             self.wait_ack()
-            self.send_body()
             self.wait_ack()
-            self.send_appendix()
             self.wait_ack()
 
             # Updating the state variables
@@ -537,24 +1093,39 @@ class FormTransmitterThread(threading.Thread):
         except Exception as exception:
             self.exception = exception
 
+    def send_form(self):
+        """
+        This method sends the title line, the body frame and the appendix of the form in one gathering call, instead
+        of a separate call for each part, which saves the round trip of waiting for the ack after each of them.
+        Returns:
+        void
+        """
+        separator = self.assemble_separator()
+        self.connection.sendall_frame_iov(
+            [self.form.body.encode(), b"\n", separator.encode()],
+            prefix=[self.form.title.encode(), b"\n"],
+            suffix=self.form.appendix_buffers
+        )
+
     def send_body(self):
         """
-        This method simply pushes the complete body string into the socket connection
+        This method sends the complete body string followed by the separation line as one length prefixed frame, so
+        that the whole body only takes a single ack instead of one round trip for every line
         Returns:
         void
         """
-        # Sending the individual lines of the body of the form over the socket
-        body_string_lines = self.form.body.split("\n")
-        for line in body_string_lines:
-            self.connection.sendall_string(line+"\n")
-            self.wait_ack()
-        # Sending the separation at last
+        # The body and the separation line are gathered into one frame, without concatenating them first
         separator = self.assemble_separator()
-        self.connection.sendall_string(separator+"\n")
+        self.connection.sendall_frame_iov([self.form.body.encode(), b"\n", separator.encode()])
 
     def send_title(self):
-        title = self.form.title + "\n"
-        self.connection.sendall_string(title)
+        """
+        This method sends the title line, the line break is gathered with the encoded title instead of being appended
+        to the title string
+        Returns:
+        void
+        """
+        self.connection.sendall_iov([self.form.title.encode(), b"\n"])
 
     def send_appendix(self):
         """
@@ -562,8 +1133,8 @@ class FormTransmitterThread(threading.Thread):
         Returns:
         void
         """
-        appendix_encoded = self.form.appendix_encoded
-        self.connection.sendall_bytes(appendix_encoded)
+        # The buffers of the encoded appendix are sent without joining them into one byte string
+        self.connection.sendall_iov(self.form.appendix_buffers)
 
     def wait_ack(self):
         """
@@ -573,8 +1144,9 @@ class FormTransmitterThread(threading.Thread):
         Returns:
         void
         """
-        response = self.connection.receive_length_bytes(3, self.timeout)
-        if not response == b'ack':
+        # The ack is received into the same preallocated buffer every time
+        self.connection.receive_into(self.ack_buffer, self.timeout)
+        if not self.ack_buffer == ACK:
             raise ValueError("Incorrect ACK sent")
 
     def check_form(self):
@@ -609,9 +1181,8 @@ class FormTransmitterThread(threading.Thread):
             # Checking for the possibility of a multi line separation string
             if "\n" in self.separation:
                 raise ValueError("The separation has to be a one line string")
-            # Checking for the possibility of a empty separation string
-            stripped_separation = self.separation.replace(" ", "")
-            if len(stripped_separation) == 0:
+            # Checking for the possibility of a empty separation string or one only made of whitespaces
+            if len(self.separation) == 0 or self.separation.isspace():
                 raise ValueError("The separation has to be a None empty string")
         else:
             raise TypeError("The separation has to be a string")
@@ -623,11 +1194,8 @@ class FormTransmitterThread(threading.Thread):
         Returns:
         void
         """
-        form_body_string = self.form.body
-        form_body_lines = form_body_string.split("\n")
-        for i in range(len(form_body_lines)):
-            if form_body_lines[i][:len(self.separation)] == self.separation:
-                raise ValueError("There is a collision of the separation string in the form body")
+        if separation_pattern(self.separation).search(self.form.body) is not None:
+            raise ValueError("There is a collision of the separation string in the form body")
 
     def assemble_separator(self):
         """
@@ -635,9 +1203,7 @@ class FormTransmitterThread(threading.Thread):
         Returns:
         The string consisting of the separation string and the length of the appendix
         """
-        appendix = self.form.appendix_encoded
-        appendix_length = len(appendix)
-        return ''.join([self.separation, str(appendix_length)])
+        return self.separation + str(self.form.appendix_length)
 
     def adjust_body_string(self):
         """
@@ -650,13 +1216,8 @@ class FormTransmitterThread(threading.Thread):
         Returns:
         void
         """
-        form_body_string = self.form.body
-        form_body_lines = form_body_string.split("\n")
-        for i in range(len(form_body_lines)):
-            if form_body_lines[i][:len(self.separation)] == self.separation:
-                form_body_lines[i] = " " + form_body_lines[i]
-        form_body_string = "\n".join(form_body_lines)
-        self.form.body = form_body_string
+        # Adding the whitespace in front of every separation string at the start of a line in a single pass
+        self.form.body = separation_pattern(self.separation).sub(r" \g<0>", self.form.body)
 
     def raise_exception(self):
         """
@@ -670,22 +1231,32 @@ class FormTransmitterThread(threading.Thread):
             raise self.exception
 
 
-class FormReceiverThread(threading.Thread):
-
-    def __init__(self, connection, separation, timeout=10):
-        threading.Thread.__init__(self)
+class FormReceiver:
+    """
+    This object receives a single form, that is being sent by a FormTransmitterThread on the other side of the
+    connection, within the thread calling 'receive'. The appendix of the received form is decoded by the given
+    appendix encoder, which thus has to be the same one, that was used by the sending side (JSON by default, or for
+    example the binary msgpack encoder).
+
+    STREAMING
+    An appendix, whose length is at least the stream threshold, is decoded with the 'decode_stream' method of the
+    encoder, while it is still being received (for json this needs ijson to be installed). The received chunks are
+    kept as the buffers of the form, so this saves the time of decoding after the reception, but not the memory.
+    """
+    def __init__(self, connection, separation, timeout=10, appendix_encoder=JsonAppendixEncoder,
+                 stream_threshold=None):
         # The socket and the wrapped socket
         self.connection = connection
-        # A string to be separating the body from the appendix
+        # A string to be separating the body from the appendix. The separation line is received and checked as bytes
         self.separation = separation
+        self.separation_bytes = separation.encode()
+        # The encoder class, with which the appendix is decoded
+        self.appendix_encoder = appendix_encoder
+        # The int min length of an appendix, which is decoded while being received. None for never streaming
+        self.stream_threshold = stream_threshold
 
         # The timeout of receiving the ack after a sending
         self.timeout = timeout
-        self.start_time = None
-        self.exception = None
-        # The state variables of the Thread and the transmission
-        self.running = False
-        self.finished = False
         # The variable for the length of the appendix to receive
         self.appendix_length = None
         # All the variables holding the relevant values for the form object
@@ -693,37 +1264,35 @@ class FormReceiverThread(threading.Thread):
         self.body = None
         self.appendix = None
         self.form = None
+        # The decoded appendix, in case it was decoded while being received
+        self.appendix_decoded = None
+        self.streamed = False
 
-    def run(self):
-        # Catching every exception and in case there is one putting it into the attribute variable
-        try:
-            self.running = True
-            self.receive_title()
-            self.send_ack()
-            self.receive_body()
-            self.send_ack()
-            self.receive_appendix()
-            self.send_ack()
-            self.assemble_form()
-            self.running = False
-            self.finished = True
-        except Exception as exception:
-            self.exception = exception
-
-    def receive_form(self):
+    def receive(self):
         """
-        This method will be blocking until the finished flag of the object was set to True and then return the
-        received form object
+        This method receives the form from the connection, assembles the form object from the received data and
+        returns it
         Returns:
         The Form object received through the socket
         """
-        while not self.finished:
-            if self.exception is None:
-                time.sleep(0.0005)
-            else:
-                self.raise_exception()
+        self.receive_data()
+        self.assemble_form()
         return self.form
 
+    def receive_data(self):
+        """
+        This method receives the title, the body and the appendix of the form and acknowledges every one of them.
+        After this method, the connection is not used anymore by this object, only the form is left to be assembled
+        Returns:
+        void
+        """
+        self.receive_title()
+        self.send_ack()
+        self.receive_body()
+        self.send_ack()
+        self.receive_appendix()
+        self.send_ack()
+
     def receive_title(self):
         """
         This method receives a single line and assigns that line as the title of the form. Because it does so, this
@@ -736,42 +1305,55 @@ class FormReceiverThread(threading.Thread):
 
     def receive_body(self):
         """
-        This method will receive the body of the form, by receiving line for line until the separation line has been
-        received. The separation line will then be processed into the length of the appendix and the received lines
-        will be processed into the body string
+        This method will receive the body of the form, which is sent as a single frame, that contains the body string
+        and the separation line as its last line. The separation line will then be processed into the length of the
+        appendix and everything before it is the body string
         Returns:
         void
         """
-        is_separation = False
-        line_list = []
-        line = None
-        # Receiving new lines from the socket, until the separation line has been received
-        while not is_separation:
-            line = self.receive_line()
-            is_separation = self.checkup_separation(line)
-            if not is_separation:
-                line_list.append(line)
-                # Sending the ack
-                self.send_ack()
-        # If the while loop exits, that means the separation has been sent and is now the last line that was received
-        # which means the string is still inside the line variable
-        self.process_separation(line)
-
-        # Assembling the line list into the body string and assigning it to the body
-        body_string = '\n'.join(line_list)
-        self.body = body_string
+        payload = self.connection.receive_frame(self.timeout)
+        # The separation line is the last line of the frame, the body can contain new lines itself. The separation
+        # line is processed as bytes, only the body has to be decoded, which is done directly from a view of the
+        # payload, so that the body bytes are not copied out of the payload first
+        index = payload.rfind(b"\n")
+        self.process_separation(payload[index + 1:])
+        with memoryview(payload) as view:
+            self.body = str(view[:max(index, 0)], "utf-8")
 
     def receive_appendix(self):
         """
         This method will receive the appendix data from the socket, by receiving exactly as many bytes as the length
-        extracted from the separation string
+        extracted from the separation string. In case the length reaches the stream threshold, the appendix is
+        decoded while it is being received
+        Returns:
+        void
+        """
+        if self.stream_threshold is not None and self.appendix_length >= self.stream_threshold:
+            self.receive_appendix_stream()
+            return
+        # Receiving as many bytes as the length was dictated by the separation string. The bytes are received directly
+        # into a buffer owned by this object, which the decoders accept as it is, so the appendix is never copied
+        appendix_buffer = bytearray(self.appendix_length)
+        self.connection.receive_into(appendix_buffer, self.timeout)
+        self.appendix = appendix_buffer
+
+    def receive_appendix_stream(self):
+        """
+        This method receives the appendix in chunks, which are decoded by the appendix encoder while they arrive. The
+        received chunks are kept as the list of the encoded appendix buffers
         Returns:
         void
         """
-        # Receiving as many bytes as the length was dictated by the separation string
-        appendix_bytes = self.connection.receive_length_bytes(self.appendix_length, timeout=self.timeout)
-        appendix_string = appendix_bytes
-        self.appendix = appendix_string
+        chunks = []
+
+        def read(size):
+            chunk = self.connection.receive_length_bytes(size, self.timeout)
+            chunks.append(chunk)
+            return chunk
+
+        self.appendix_decoded = self.appendix_encoder.decode_stream(read, self.appendix_length)
+        self.appendix = chunks
+        self.streamed = True
 
     def receive_line(self):
         """
@@ -787,18 +1369,15 @@ class FormReceiverThread(threading.Thread):
         This method will take the separation line, check it for its validity and in case it is correct extract the
         appendix length from the string and then assign this length to the length attribute of this object
         Args:
-            line: the string line to be processed for the length of the appendix
+            line: the bytes line to be processed for the length of the appendix
 
         Returns:
         void
         """
         # Checking if this actaully is the separation string line
         self.check_separation(line)
-        # Removing the actual separation string from the line
-        length_string = line.replace(self.separation, "")
-        length_string.strip()
-        # Turning the string into a number
-        length = int(length_string)
+        # Turning the rest of the line after the separation string into a number, int also accepts the bytes
+        length = int(line[len(self.separation_bytes):])
         # Assigning that length value to the designated attribute of this object
         self.appendix_length = length
 
@@ -813,28 +1392,32 @@ class FormReceiverThread(threading.Thread):
         """
         # Checking if all the data has been received and if it is save to assemble a Form object from that data
         self.check_form()
-        # Building the Form object from the received data
-        form = Form(self.title, self.body, self.appendix)
+        # Building the Form object from the received data. The title is a single line and the body a string for sure,
+        # so the form does not need to be checked
+        if self.streamed:
+            form = Form.from_decoded(self.title, self.body, self.appendix_decoded, self.appendix, self.appendix_encoder)
+        else:
+            form = Form.from_trusted(self.title, self.body, self.appendix, self.appendix_encoder)
         self.form = form
 
     def check_separation(self, line):
         """
-        This method checks, whether the passed object is a string and then also checks if that string is actually the
-        separation string by calling the checkup method for the separation string. An exception will be risen in case
-        either one of the conditions is not met.
+        This method checks, whether the passed object is a bytes string and then also checks if that string is
+        actually the separation string by calling the checkup method for the separation string. An exception will be
+        risen in case either one of the conditions is not met.
         This method is used to assure, that the correct object is being used for further processing
         Raises:
             ValueError
             TypeError
         Args:
-            line: The string line, which is supposed to be the separation string
+            line: The bytes line, which is supposed to be the separation string
 
         Returns:
         void
         """
-        # Raising an error, in case the passed object is not a string or not the separation string
-        if not isinstance(line, str):
-            raise TypeError("The passed line is not even a string")
+        # Raising an error, in case the passed object is not a bytes string or not the separation string
+        if not isinstance(line, bytes):
+            raise TypeError("The passed line is not even a bytes string")
         if not self.checkup_separation(line):
             raise ValueError("The passed line is not the separation string")
 
@@ -852,30 +1435,87 @@ class FormReceiverThread(threading.Thread):
 
     def checkup_separation(self, line):
         """
-        This method checks whether the the passed line string is the separation line, that is meant to separate the
+        This method checks whether the the passed bytes line is the separation line, that is meant to separate the
         body from the appendix and returns the boolean value of that being the case ot not
         Args:
-            line: The string of the receuved line to check
+            line: The bytes of the received line to check
 
         Returns:
         The boolean value of the line being the separation line or not
         """
-        # The first condition of the line being the separation is it being longer than the sep string alone
-        if len(line) > len(self.separation):
-            separation_length = len(self.separation)
-            if line[:separation_length] == self.separation:
-                return True
-        # In case one of the conditions was not given, False is returned
-        return False
+        # The line has to be longer than the separation string alone, as the appendix length follows it
+        return len(line) > len(self.separation_bytes) and line.startswith(self.separation_bytes)
 
     def send_ack(self):
         """
-        This method simply sends a string with the ack to the transmitting end, wo signal, that the connection is still
+        This method simply sends the ack byte to the transmitting end, wo signal, that the connection is still
         active
         Returns:
         void
         """
-        self.connection.sendall_bytes(b"ack")
+        self.connection.sendall_bytes(ACK)
+
+
+class FormReceiverThread(FormReceiver, threading.Thread):
+    """
+    This is a Thread, which receives a single form with a FormReceiver. The connection is released as soon as the data
+    of the form has been received, which can be waited for with 'wait_received', the appendix might still be decoded
+    afterwards.
+    """
+    def __init__(self, connection, separation, timeout=10, appendix_encoder=JsonAppendixEncoder,
+                 stream_threshold=None):
+        threading.Thread.__init__(self)
+        FormReceiver.__init__(self, connection, separation, timeout=timeout, appendix_encoder=appendix_encoder,
+                              stream_threshold=stream_threshold)
+        self.start_time = None
+        self.exception = None
+        # The state variables of the Thread and the transmission
+        self.running = False
+        self.finished = False
+        # The event is set as soon as all the data of the form has been received from the connection, the decoding of
+        # the appendix is done afterwards
+        self.received = threading.Event()
+        # The event is set as soon as the reception is done, either successfully or with an exception
+        self.done = threading.Event()
+
+    def run(self):
+        # Catching every exception and in case there is one putting it into the attribute variable
+        try:
+            self.running = True
+            self.receive_data()
+            # The connection is not used anymore, the next form can already be received while this thread decodes
+            self.received.set()
+            self.assemble_form()
+            self.running = False
+            self.finished = True
+        except Exception as exception:
+            self.exception = exception
+        finally:
+            # Waking up the threads waiting for the form, no matter if it was received or an exception occurred
+            self.received.set()
+            self.done.set()
+
+    def wait_received(self):
+        """
+        This method will be blocking until all the data of the form has been received from the connection. The
+        appendix might still be decoded by the thread afterwards, but the connection is free to be used for the
+        reception of the next form, while the decoding is done
+        Returns:
+        void
+        """
+        self.received.wait()
+        self.raise_exception()
+
+    def receive_form(self):
+        """
+        This method will be blocking until the reception of the form is done and then return the received form object.
+        In case the reception failed, the exception of the Thread is raised instead
+        Returns:
+        The Form object received through the socket
+        """
+        self.done.wait()
+        self.raise_exception()
+        return self.form
 
     def raise_exception(self):
         """
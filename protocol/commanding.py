@@ -7,19 +7,82 @@ WHAT TO MAKE THE COMMANDING PROTOCOL BETTER?
 """
 from network.form import Form
 from network.form import FormTransmitterThread
-from network.form import FormReceiverThread
+from network.form import FormReceiver
 
 from network.polling import GenericPoller
 
 import threading
+import builtins
+import socket
 import random
 import queue
 import time
+import sys
 
 # THE COMMANDING PROTOCOL
 
 
-class CommandContext:
+# This dict maps the string names of all the built in exception classes to the classes themselves. It is used to
+# recreate a received exception from the name within an error form, without having to evaluate the name as code.
+# Error forms only carry subclasses of Exception, thus SystemExit, KeyboardInterrupt and GeneratorExit are left out.
+EXCEPTION_CLASSES = {
+    name: obj for name, obj in vars(builtins).items() if isinstance(obj, type) and issubclass(obj, Exception)
+}
+
+# The translation table, which makes an exception message safe to be used as a line of the error form body
+MESSAGE_LINE_TRANSLATION = str.maketrans({":": ";", "\n": " ", "\r": " "})
+
+# The lines of the request and the ack, which are exchanged before every form, are kept as bytes to be sent directly
+REQUEST_LINE = b"request\n"
+ACK_LINE = b"ack\n"
+
+
+def register_exception(exception_class):
+    """
+    This function registers a custom exception class, so that exceptions of this type, that are received with an
+    error form can be recreated as objects of that class. Unregistered exceptions are recreated as plain Exception.
+    Args:
+        exception_class: The class, which inherits from Exception, to be registered by its name
+
+    Returns:
+    The exception class, so that the function can also be used as a class decorator
+    """
+    if not (isinstance(exception_class, type) and issubclass(exception_class, Exception)):
+        raise TypeError("Only exception classes can be registered for the error forms")
+    EXCEPTION_CLASSES[exception_class.__name__] = exception_class
+    return exception_class
+
+
+class CommandContextType(type):
+    """
+    This is the metaclass of the CommandContext. It keeps the COMMANDS tables of a context class and all of its sub
+    classes up to date, in case a command method is set, replaced (for example by mock.patch) or deleted on the class
+    after it has been created.
+    """
+    def __setattr__(cls, name, value):
+        type.__setattr__(cls, name, value)
+        if name.startswith(cls.COMMAND_PREFIX):
+            cls.update_commands()
+
+    def __delattr__(cls, name):
+        type.__delattr__(cls, name)
+        if name.startswith(cls.COMMAND_PREFIX):
+            cls.update_commands()
+
+    def update_commands(cls):
+        """
+        This method rebuilds the COMMANDS table of the class and of all the classes inheriting from it
+        Returns:
+        void
+        """
+        classes = [cls]
+        while classes:
+            klass = classes.pop()
+            type.__setattr__(klass, "COMMANDS", klass.collect_commands())
+            classes.extend(klass.__subclasses__())
+
+
+class CommandContext(metaclass=CommandContextType):
     """
     BASE CLASS
     This is the base class for all specific CommandContext objects. The command context objects are supposed to be
@@ -34,10 +97,46 @@ class CommandContext:
     EXECUTING COMMANDS:
     The commandContext objects ca be used to directly execute commands, described by a CommandingForm sub class, by
     being passed to the execute method.
+
+    Attributes:
+        COMMANDS: The class attribute dict, which maps the command names to the (unbound) methods implementing them.
+            Every sub class gets its own dict, that is built when the class is being created and rebuilt whenever a
+            command attribute of the class or one of its parents is set or deleted.
     """
+    COMMAND_PREFIX = "command_"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.COMMANDS = cls.collect_commands()
+
     def __init__(self):
         pass
 
+    @classmethod
+    def collect_commands(cls):
+        """
+        This method collects all the methods of the class, whose names start with the command prefix, including the
+        ones inherited from the parent classes, into a dict, which maps the command names to the method objects, as
+        they are stored in the class dicts. Methods of sub classes override those of their parents. Attributes, which
+        are not callable (like a string 'command_label'), are no commands and also hide a command of a parent class.
+
+        Returns:
+        The dict with the string command names as keys and the method objects as values
+        """
+        prefix = cls.COMMAND_PREFIX
+        commands = {}
+        # Going from the base classes to the most specific class, so that overridden methods replace the parent ones
+        for klass in reversed(cls.__mro__):
+            for name, method in vars(klass).items():
+                if not name.startswith(prefix):
+                    continue
+                # Class methods are the only methods, whose raw class attribute is not callable
+                if callable(method) or isinstance(method, classmethod):
+                    commands[name[len(prefix):]] = method
+                else:
+                    commands.pop(name[len(prefix):], None)
+        return commands
+
     def execute_form(self, form):
         """
         A CommandingForm subclass can be passed to this method and the action corresponding to the type of form will be
@@ -50,18 +149,13 @@ class CommandContext:
         Either the return of the executed command or the return value of a remote executed function
         """
         if isinstance(form, Form):
-            if form.title == "COMMAND":
-                form = CommandForm(form)
-            elif form.title == "RETURN":
-                form = ReturnForm(form)
-            elif form.title == "ERROR":
-                form = ErrorForm(form)
+            form = CommandingBase.evaluate_commanding_form(form)
         if isinstance(form, CommandingForm):
             if isinstance(form, CommandForm):
                 # Getting the method, that actually executes the behaviour for that command
                 command = self.lookup_command(form.command_name)
                 # Executing the command with the pos and kw args
-                return command(*form.pos_args, **form.key_args)
+                return command(*form.pos_args, **form.kw_args)
             elif isinstance(form, ReturnForm):
                 # Simply returning the value stored in the form
                 return form.return_value
@@ -78,14 +172,33 @@ class CommandContext:
         Args:
             command_name: The command name to which the method/ function object is requested
 
+        Notes:
+            The methods are being looked up in the COMMANDS table of the class, which is kept up to date with the
+            class attributes and only ever contains callables. Commands not in the table (e.g. set on the object
+            itself) are looked up by their name every time, without being cached.
+        Raises:
+            AttributeError: In case the command context does not implement the command or the attribute with the
+                command name is not callable
         Returns:
         The function object of the internal command context method with the name specified by the command name
         """
+        context_class = self.__class__
         try:
-            command_method_name = self.assemble_command_name(command_name)
-            return getattr(self, command_method_name)
-        except AttributeError as attribute_error:
-            raise attribute_error
+            method = context_class.COMMANDS[command_name]
+        except KeyError:
+            # The table contains all callable class attributes, so whatever is found here belongs to the object and
+            # is already bound. Nothing is cached, as the table has to stay the same for all objects of the class
+            method = getattr(self, self.assemble_command_name(command_name))
+            if not callable(method):
+                raise AttributeError("The command context does not implement the command '{}'".format(command_name))
+            return method
+
+        # Binding the method of the class to this very context object. Callable objects, which are no descriptors
+        # (like a mock) are returned as they are, just like getattr would
+        bind = getattr(type(method), "__get__", None)
+        if bind is None:
+            return method
+        return bind(method, self, context_class)
 
     @staticmethod
     def assemble_command_name(command_name):
@@ -103,8 +216,7 @@ class CommandContext:
         Returns:
         The string name of the CommandContext method corresponding to the command name given
         """
-        string_list = ["command_", command_name]
-        command_method_name = ''.join(string_list)
+        command_method_name = CommandContext.COMMAND_PREFIX + command_name
         return command_method_name
 
     def command_time(self,):
@@ -120,6 +232,10 @@ class CommandContext:
         return time.time()
 
 
+# The base class itself is not affected by __init_subclass__, thus its own table has to be built explicitly
+CommandContext.COMMANDS = CommandContext.collect_commands()
+
+
 class CommandingForm:
     """
     INTERFACE
@@ -157,7 +273,8 @@ class CommandingForm:
     send does not only have to be created from abstract specifications about the functionality, i.e. the command name
     args, return, but also that info has to be created from the Form. For that purpose this base class
     enforces the implementation of a static method "from_form(form)" which is supposed to take a form and create the
-    form wrapper sub class from that (backward direction)
+    form wrapper sub class from that (backward direction). The wrapper created this way keeps the given Form instead
+    of building a new one from the extracted parameters.
 
     GENERAL STRUCTURE OF A COMMANDING FORM
     A CommandingForm wrapper creates a Form object, which is then supposed to be sent over the network. This Form has
@@ -165,15 +282,34 @@ class CommandingForm:
     - Title: The title tells which type CommandingForm has created the Form, by a string in caps
     - Body: The body specifies general information in dictionary like format, separated by newline characters. Each
       each line in the body is separated by a ':' character between the key and the value of the dict like relation.
-      This also implicates, that a value in the body cannot possibly contain a ':' character!
+      The key of a line cannot contain a ':' character, since the line is separated at the first one.
     - Appendix: This is a python dictionary object, serialized, and can contain everything possible according to the
       limitations of the encoder and is absolutely up to the specific sub class
 
     Attributes:
         form: The actual Form object, that has to be created to be sent over the network
         _spec: The dict containing all the attributes
+        FORM_TITLE: The class attribute with the title for the forms of each sub class. It is derived once from the
+            class name, when the sub class is being created
+        FORM_CLASSES: The class attribute dict, which maps the form titles to the sub classes, that create the forms
+            with these titles. The sub classes are being registered, when they are created
     """
-    def __init__(self, spec_dict):
+    # The wrappers only ever hold the spec dict and the form, using slots keeps the many small wrapper objects, that
+    # are created for every command, return and error, free of an instance dict
+    __slots__ = ("_spec", "form")
+
+    FORM_TITLE = None
+    FORM_CLASSES = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Ripping the class name of the trailing Form sub string, leaving only the substring that specifies the
+        # purpose of the sub class, which is then used in all-upper-case as the title of the forms. Only the suffix
+        # is removed, so that a "Form" within the purpose stays part of the title
+        cls.FORM_TITLE = cls.__name__.removesuffix("Form").upper()
+        CommandingForm.FORM_CLASSES[cls.FORM_TITLE] = cls
+
+    def __init__(self, spec_dict, form=None):
         self._spec = spec_dict
         # Adding the title title of the form to the spec dict
         self._spec["title"] = self.procure_title()
@@ -181,8 +317,11 @@ class CommandingForm:
         # Checking if the actually is a dict
         self._check_spec()
 
-        # Building the form according to the specific implementations
-        self.form = self.build_form()
+        # Building the form according to the specific implementations. In case the wrapper is created from a
+        # received Form, that Form already represents the wrapper and there is no need to build it again
+        if form is None:
+            form = self.build_form()
+        self.form = form
 
     def build_form(self):
         """
@@ -215,17 +354,14 @@ class CommandingForm:
         what the specific sub class is being used for. And exactly that substring is calculated and in all-upper-case
         used as the title for each of those Forms
 
+        Notes:
+            The title only depends on the class, thus it is computed only once, when the sub class is being created
+            and stored as the class attribute 'FORM_TITLE'.
+
         Returns:
         The string title of the form. (Only characters, all upper case)
         """
-        # Getting the class name of the specific sub class
-        class_name_string = str(self.__class__)
-        # Ripping the class name of the Form sub string, leaving only the substring that specifies the purpose of the
-        # sub class
-        title_string = class_name_string.replace("<class '", "").replace("Form'>", "")
-        # Making it all upper case
-        title_string_upper = title_string.upper()
-        return title_string_upper
+        return self.FORM_TITLE
 
     def procure_body(self):
         """
@@ -315,7 +451,7 @@ class CommandingForm:
         Returns:
         The boolean value of whether or not the string key is part of the object
         """
-        return item in self._spec.keys()
+        return item in self._spec
 
     def __str__(self):
         raise NotImplementedError()
@@ -398,11 +534,15 @@ class CommandingForm:
         """
         This function takes a Form object as input and then attempts to turn the body into a dictionary, by
         interpreting the individual lines of the body string as key value pairs of strings, which are separated by
-        a ':' character. Thus if the given Form ought to be a valid command form, each line in the body has to have
-        exactly one of these separation character.
+        a ':' character. Thus if the given Form ought to be a valid command form, each line in the body has to
+        contain this separation character. Empty lines are skipped.
         The resulting dict will have string keys and string values only.
+        Notes:
+            The body is parsed in a single pass, every line is only split at its first ':' character, which does
+            not create a list for every line. This means a value could also contain ':' characters.
+            The keys of the dict are interned strings.
         Raises:
-            ValueError: In case there is not exactly on ':' character in a line
+            ValueError: In case there is no ':' character in a line
         Args:
             form: The Form object, whose body is to be turned into a dict
 
@@ -413,15 +553,18 @@ class CommandingForm:
 
         # Turning the body of the form into a dict in the way of taking each line of the line list as a key value pair
         # separated by the ':' character
-        for line in form.body_list:
-            line_split = line.split(":")
+        for line in form.body.split("\n"):
+            if not line:
+                continue
+            key, separator, value = line.partition(":")
 
-            # Checking if there actually is exactly one separation character
-            if len(line_split) != 2:
-                raise ValueError("The body of command form has to be separated by exactlky one ':' character")
+            # Checking if there actually is a separation character
+            if not separator:
+                raise ValueError("The body of command form has to be separated by a ':' character")
 
-            # Adding the key value tuple as item to the dict
-            body_dict[line_split[0]] = line_split[1]
+            # Adding the key value tuple as item to the dict. The keys are interned, so that the lookups with the
+            # literal key strings find them by identity
+            body_dict[sys.intern(key)] = value
 
         return body_dict
 
@@ -429,7 +572,12 @@ class CommandForm(CommandingForm):
     """
     This is a sub class to the CommandingForm base class
     """
-    def __init__(self, command, pos_args=[], kw_args={}, return_mode="reply", error_mode="reply"):
+    __slots__ = ()
+
+    # The keys of the spec dict, whose values are being sent as the lines of the form body
+    BODY_KEYS = ("command", "return_mode", "error_mode")
+
+    def __init__(self, command, pos_args=[], kw_args={}, return_mode="reply", error_mode="reply", form=None):
         # Creating dictionary, which holds the parameters of the object
         spec = {
             "command": command,
@@ -441,7 +589,7 @@ class CommandForm(CommandingForm):
 
         # Passing the dict to the constructor of the base class, as it is assigned as the instance attribute _spec
         # there, also base class provides key indexing magic method for the instance with that dict
-        CommandingForm.__init__(self, spec)
+        CommandingForm.__init__(self, spec, form)
 
     def procure_body(self):
         """
@@ -455,32 +603,11 @@ class CommandForm(CommandingForm):
         """
         # Creating the line list for the form body with the relevant information about the command name, the return
         # mode and the error mode. Then returning that list so it can be used as the body parameter for the Form constr.
-        body_line_list = [
-            self._procure_body_line("command"),
-            self._procure_body_line("return_mode"),
-            self._procure_body_line("error_mode")
-        ]
+        spec = self._spec
+        body_line_list = ["{}:{}".format(key, spec[key]) for key in self.BODY_KEYS]
 
         return body_line_list
 
-    def _procure_body_line(self, key):
-        """
-        This method takes the string key of a entry of the spec dict and therefore the name of a attrubute if the
-        object and then merges this string key with the value into a single string, separated by the ':' character,
-        after calling the string conversion in the value.
-        Raise:
-            KeyError: In case the the specified string does not specify an actual parameter in the dict
-        Args:
-            key: The string name of a attribute of the object, which is in the spec dict, that is supposed to be merged
-                with its value into a line for the body of the form.
-
-        Returns:
-        The string, that consists if both the given string key and the corresponding value of the spec dict
-        """
-        # Simply Joining the key and the value of the chosen entry of the spec dict with the ':' string as separator
-        line_string = ':'.join([key, self[key]])
-        return line_string
-
     def procure_appendix(self):
         """
         This method creates the Form appendix from command call parameters given. The appendix will be a dict object
@@ -515,17 +642,18 @@ class CommandForm(CommandingForm):
         """
         This method checks if the appendix object of the form is a dictionary and if that dict has the two entries for
         the pos args and the kw args, as it has to be with a command form
+        Raises:
+            TypeError: In case the appendix of the form is not a dict
+            KeyError: In case the appendix dict does not have exactly the entries for the pos and the kw args
         Returns:
         void
         """
+        appendix = self.form.appendix
         # Checking if the appendix even is a dictionary
-        dict_type = not isinstance(self.appendix, dict)
-        if dict_type:
+        if not isinstance(appendix, dict):
             raise TypeError("The appendix of the command form is supposed ot be a dict!")
-        # Checking if the entries of the appendix dict are correct
-        keys = self.appendix.keys()
-        entries = len(keys) != 2 or 'pos_args' not in keys() or 'kw_args' not in keys()
-        if entries:
+        # Checking if the entries of the appendix dict are correct, the keys view can be compared to a set directly
+        if appendix.keys() != {"pos_args", "kw_args"}:
             raise KeyError("The entries of form appendix do not match command form!")
 
     @property
@@ -538,7 +666,7 @@ class CommandForm(CommandingForm):
         Returns:
         The string flag for the error behaviour
         """
-        return self["error_mode"]
+        return self._spec["error_mode"]
 
     @property
     def return_mode(self):
@@ -550,7 +678,7 @@ class CommandForm(CommandingForm):
         Returns:
         The string flag for the return behaviour
         """
-        return self["return_mode"]
+        return self._spec["return_mode"]
 
     @property
     def kw_args(self):
@@ -562,7 +690,17 @@ class CommandForm(CommandingForm):
         Returns:
         The dict, which represents the kw args for the command call
         """
-        return self["kw_args"]
+        return self._spec["kw_args"]
+
+    @property
+    def key_args(self):
+        """
+        The alias of the 'kw_args' property
+
+        Returns:
+        The dict, which represents the kw args for the command call
+        """
+        return self._spec["kw_args"]
 
     @property
     def pos_args(self):
@@ -574,7 +712,7 @@ class CommandForm(CommandingForm):
         Returns:
         The list of elements used as the positional arguments of the function
         """
-        return self["pos_args"]
+        return self._spec["pos_args"]
 
     @property
     def command_name(self):
@@ -585,7 +723,7 @@ class CommandForm(CommandingForm):
         Returns:
         The string command name of the command to be executed
         """
-        return self["command_name"]
+        return self._spec["command"]
 
     def __str__(self):
         # TODO: Write str method for COmmand Form
@@ -597,6 +735,8 @@ class CommandForm(CommandingForm):
         This function takes a Form object and first checks if it is actually meant to be CommandForm, if it is
         all the important parameters are being exrtacted from the Form and a CommandForm wrapper is created from
         those parameters.
+        Raises:
+            ValueError: In case the body of the form does not contain the command name, error and return mode
         Args:
             form: The Form object to turn into a CommandForm
 
@@ -606,20 +746,25 @@ class CommandForm(CommandingForm):
         # Checking if the form even is a Form
         CommandForm._check_form(form)
         # Checking if the form is even meant to be a commanding form
-        CommandForm._check_title(form)
+        CommandForm._check_title(form, CommandForm.FORM_TITLE)
+
+        # Getting the pos and the kw args. The appendix is checked first, as it is cheaper than parsing the body, so
+        # that an invalid form is rejected without parsing the body
+        pos_args, kw_args = CommandForm._procure_args(form)
 
         # Getting the command name and the error and return mode from the body by using a dict, that was created from
         # the body string, by applying the CommandForm rules for creation
         body_dict = CommandForm._procure_body_dict(form)
-        command_name = body_dict["command"]
-        error_mode = body_dict["error_mode"]
-        return_mode = body_dict["return_mode"]
-
-        # Getting the pos and the kw args
-        pos_args, kw_args = CommandForm._procure_args(form)
+        try:
+            command_name = body_dict["command"]
+            error_mode = body_dict["error_mode"]
+            return_mode = body_dict["return_mode"]
+        except KeyError as key_error:
+            raise ValueError("The body of the command form does not contain {}".format(key_error))
 
         # Creating the CommandForm object from that and returning that
-        command_form = CommandForm(command_name, pos_args, kw_args, error_mode=error_mode, return_mode=return_mode)
+        command_form = CommandForm(command_name, pos_args, kw_args, error_mode=error_mode, return_mode=return_mode,
+                                   form=form)
         return command_form
 
     @staticmethod
@@ -657,23 +802,27 @@ class ReturnForm(CommandingForm):
     """
     pass
     """
-    def __init__(self, return_value):
+    __slots__ = ()
+
+    def __init__(self, return_value, form=None):
         # Creating the dict with all the attributes, that define the object
         spec = {
             "return_value": return_value,
             "return_type": type(return_value)
         }
-        CommandingForm.__init__(self, spec)
+        CommandingForm.__init__(self, spec, form)
 
     def procure_body(self):
         """
         This creates the body of the form as a list of string entries, each representing a line in the body string.
-        There will only be one line, which is the type of the return value.
+        There will only be one line, which is the name of the type of the return value.
+        Examples:
+            ['type:int']
 
         Returns:
         The list with the line string(s)
         """
-        line_string = ':'.join(["type", str(self.return_type)])
+        line_string = "type:" + self.return_type.__name__
         return [line_string]
 
     def procure_appendix(self):
@@ -695,7 +844,7 @@ class ReturnForm(CommandingForm):
         Returns:
         The return value, whatever that may be
         """
-        return self["return_value"]
+        return self._spec["return_value"]
 
     @property
     def return_type(self):
@@ -704,7 +853,7 @@ class ReturnForm(CommandingForm):
         Returns:
         A type object
         """
-        return self["return_type"]
+        return self._spec["return_type"]
 
     def __str__(self):
         pass
@@ -725,12 +874,12 @@ class ReturnForm(CommandingForm):
         # Checking if the passed object is a form
         ReturnForm._check_form(form)
         # Checking if the given form is actually meant to be a return form by checking the title
-        ReturnForm._check_title(form, "RETURN")
+        ReturnForm._check_title(form, ReturnForm.FORM_TITLE)
 
         # Getting the return value from the form
         return_value = ReturnForm._procure_return_value(form)
         # Creating the return form wrapper from that value and returning that
-        return_form = ReturnForm(return_value)
+        return_form = ReturnForm(return_value, form)
 
         return return_form
 
@@ -762,7 +911,9 @@ class ErrorForm(CommandingForm):
     """
 
     """
-    def __init__(self, exception):
+    __slots__ = ()
+
+    def __init__(self, exception, form=None):
         # Creating the spec dict with the actual exception object, the string name and the string message
         spec = {
             "exception": exception,
@@ -770,7 +921,7 @@ class ErrorForm(CommandingForm):
             "exception_message": self._procure_exception_message(exception)
         }
         # Init super class with the created spec
-        CommandingForm.__init__(self, spec)
+        CommandingForm.__init__(self, spec, form)
 
     def procure_appendix(self):
         """
@@ -813,12 +964,9 @@ class ErrorForm(CommandingForm):
         Returns:
         The string of the error message, safe for use in the body of the form
         """
-        # Getting the string of the exception message
-        message_line = self.exception_message
-
-        # There shall be no newline character and no ":" due to the rules of the commanding protocol
-        message_line = message_line.replace(":", ";")
-        message_line = message_line.replace("\n", " ")
+        # There shall be no newline character and no ":" due to the rules of the commanding protocol, all of them are
+        # replaced within a single pass over the message string
+        message_line = self.exception_message.translate(MESSAGE_LINE_TRANSLATION)
 
         return message_line
 
@@ -871,7 +1019,7 @@ class ErrorForm(CommandingForm):
         Returns:
         The exception, that is subject to this object
         """
-        return self["exception"]
+        return self._spec["exception"]
 
     @property
     def exception_class_name(self):
@@ -882,7 +1030,7 @@ class ErrorForm(CommandingForm):
         Returns:
         The string class name of the exception, which is subject to this object
         """
-        return self["exception_type"]
+        return self._spec["exception_type"]
 
     @property
     def exception_message(self):
@@ -893,7 +1041,7 @@ class ErrorForm(CommandingForm):
         Returns:
         The string of the message
         """
-        return self["exception_message"]
+        return self._spec["exception_message"]
 
     def __str__(self):
         pass
@@ -902,8 +1050,10 @@ class ErrorForm(CommandingForm):
     def from_form(form):
         """
         This function creates a new ErrorForm wrapper object from an already existing form, created from a ErrorForm.
-        The name and the message string of the error in the forms body are being used to create a dynamic eval statement
-        of a new created Exception message of the type defined by the name string and the given message.
+        The name string of the error in the forms body is being looked up in the registered exception classes and a
+        new exception of that class is created with the message string. In case the name is not known or the class
+        can not be created from the message alone (like UnicodeDecodeError), a plain Exception with the name and the
+        message is created instead.
         The function will also check first if the passed object is even a form and if this form is actually meant to be
         an ErrorForm
         Args:
@@ -913,14 +1063,17 @@ class ErrorForm(CommandingForm):
         The created ErrorForm object
         """
         ErrorForm._check_form(form)
-        ErrorForm._check_title(form, "ERROR")
+        ErrorForm._check_title(form, ErrorForm.FORM_TITLE)
 
         body_dict = ErrorForm._procure_body_dict(form)
         error_name = body_dict["name"]
         error_message = body_dict["message"]
 
-        exception = eval("""{}("{}")""".format(error_name, error_message))
-        return ErrorForm(exception)
+        try:
+            exception = EXCEPTION_CLASSES[error_name](error_message)
+        except (KeyError, TypeError):
+            exception = Exception("{}: {}".format(error_name, error_message))
+        return ErrorForm(exception, form)
 
 
 class CommandingBase(threading.Thread):
@@ -942,10 +1095,10 @@ class CommandingBase(threading.Thread):
         void
         """
         # Sending a request to the other side of the connection
-        self.connection.sendall_string("request\n")
-        # Waiting for the ack
-        line_string = self.wait_line()
-        if line_string != "ack":
+        self.connection.sendall_bytes(REQUEST_LINE)
+        # Waiting for the ack, the line is compared as bytes, so it does not have to be decoded
+        line = self.connection.wait_bytes_until_byte(b"\n")
+        if line != ACK_LINE[:-1]:
             raise ValueError("The ack was not replied")
 
     def wait_request(self):
@@ -958,9 +1111,9 @@ class CommandingBase(threading.Thread):
         Returns:
         void
         """
-        # Waiting for a line to be received by the connection
-        line_string = self.wait_line()
-        if line_string != "request":
+        # Waiting for a line to be received by the connection, the line is compared as bytes
+        line = self.connection.wait_bytes_until_byte(b"\n")
+        if line != REQUEST_LINE[:-1]:
             raise ValueError("The client has sent wrong request identifier")
         # Sending the ack in response
         self.send_ack()
@@ -973,16 +1126,20 @@ class CommandingBase(threading.Thread):
         Returns:
         void
         """
-        self.connection.sendall_string("ack\n")
+        self.connection.sendall_bytes(ACK_LINE)
 
     def wait_line(self):
         """
         This method will wait an indefinite amount of time until a string is being sent over a the connection and will
         then eventually return the substring until a new line character has occurred in the stream
+        Notes:
+            The connection receives the data in chunks and keeps everything after the new line in its buffer, so the
+            line is not being received byte by byte. The break character is passed as bytes already, to skip the
+            encoding of the character for every line.
         Returns:
         The received string
         """
-        return self.connection.wait_string_until_character("\n")
+        return self.connection.wait_bytes_until_byte(b"\n").decode()
 
     def send_command_context_type(self):
         """
@@ -1046,14 +1203,12 @@ class CommandingBase(threading.Thread):
         """
         if not isinstance(form, Form):
             raise TypeError("Only Form objects can be evaluated to CommandingForm objects")
-        if form.title == "COMMAND":
-            return CommandForm(form)
-        elif form.title == "RETURN":
-            return ReturnForm(form)
-        elif form.title == "ERROR":
-            return ErrorForm(form)
-        else:
-            raise ValueError("The received form '{}' is not a commanding form")
+        # Looking up the wrapper class by the title of the form, all the sub classes register themselves by title
+        try:
+            form_class = CommandingForm.FORM_CLASSES[form.title]
+        except KeyError:
+            raise ValueError("The received form '{}' is not a commanding form".format(form.title))
+        return form_class.from_form(form)
 
 
 class CommandingHandler(CommandingBase):
@@ -1062,21 +1217,21 @@ class CommandingHandler(CommandingBase):
         # Initializing the super class
         CommandingBase.__init__(self, connection, command_context)
 
-        # Setting the running state variable to True
-        self.running = True
+        # The event is set, when the handler is being stopped. (Thread already uses the name '_stop')
+        self.stop_event = threading.Event()
 
     def run(self):
         """
         When the CommandingHandler Thread os being started it will first validate  with the connected client (For a
         explanation read the validate method). Then the main loop will be entered. In the main loop the handler will
         call a blocking receive call on the connection, waiting for a communication request coming from the client.
-        After a request has been received and responded with an ack, A FormReceiverThread will be started to
-        receive the CommandForm, which specifies the command to be executed, The command form will be executed by the
-        CommandContext and depending on the case a ReturnForm or a ErrorForm will be created and then sent back via
-        the FormTransmitterThread.
+        After a request has been received and responded with an ack, the CommandForm is received within the handler
+        thread by a FormReceiver. The CommandForm, which specifies the command to be executed, will be executed by
+        the CommandContext and depending on the case a ReturnForm or a ErrorForm will be created and then sent back
+        via the FormTransmitterThread.
         Notes:
             It is important, that the receive call in the main loop is blocking and thus the Thread can not be
-            terminated by simply inverting the running flag, but the socket has to be closed forcefully. This method
+            terminated by simply setting the stop event, but the socket has to be closed forcefully. This method
             will buffer the exception in such a case.
         Returns:
         void
@@ -1084,13 +1239,11 @@ class CommandingHandler(CommandingBase):
         try:
             # Checking if the connection client is compatible
             self.validate()
-            while self.running:
+            while not self.stop_event.is_set():
                 self.wait_request()
 
                 # Receiving the form
-                receiver = FormReceiverThread(self.connection, self.separation)
-                receiver.start()
-                form = receiver.receive_form()
+                form = self.receive_form()
                 # Creating the commanding form wrapper from the plain form
                 commanding_form = self.evaluate_commanding_form(form)
                 # Executing the commanding form
@@ -1103,6 +1256,22 @@ class CommandingHandler(CommandingBase):
                 self._send_form(response.form)
         except ConnectionAbortedError:
             pass
+        except (EOFError, OSError):
+            # Closing the socket to stop the handler interrupts the blocking receive call, which is not an error
+            if not self.stop_event.is_set():
+                raise
+
+    def receive_form(self):
+        """
+        This method receives a form from the connection and returns it.
+        Notes:
+            The handler thread would only be waiting for a receiver thread to finish, thus the form is received by a
+            FormReceiver directly within the handler thread, instead of spawning a new thread for every request.
+        Returns:
+        The received Form object
+        """
+        receiver = FormReceiver(self.connection, self.separation)
+        return receiver.receive()
 
     def execute_form(self, commanding_form):
         """
@@ -1128,8 +1297,29 @@ class CommandingHandler(CommandingBase):
         if str(self.command_context_class) != line_string:
             raise ConnectionAbortedError("The client and server do not have the same command context")
 
+    @property
+    def running(self):
+        """
+        Whether the handler has not been stopped yet.
+
+        Returns:
+        The boolean value of whether the stop event has not been set
+        """
+        return not self.stop_event.is_set()
+
     def stop(self):
-        self.running = False
+        """
+        This method stops the handler by setting the stop event and closing the socket, which interrupts the blocking
+        receive call in the main loop.
+        Returns:
+        void
+        """
+        self.stop_event.set()
+        # Only closing the socket does not wake up a receive call blocking in another thread, the shutdown does
+        try:
+            self.connection.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
         self.connection.sock.close()
 
     def _check_command_context(self):
@@ -1169,8 +1359,8 @@ class CommandingClient(CommandingBase):
             while self.running:
                 # Check the Que not to be empty
                 if self.call_queue.empty():
-                    # Updating the idle time
-                    self.idle_time = time.time() - self.last_activity_timestamp
+                    # Updating the idle time. The monotonic clock can not jump, when the system time is adjusted
+                    self.idle_time = time.monotonic() - self.last_activity_timestamp
                     # First checking if the object actually has polling enabled and then if the poller tells that the
                     # interval for activity has been exceeded
                     """
@@ -1191,9 +1381,8 @@ class CommandingClient(CommandingBase):
                     call_id, command_name, pos_args, kw_args = self.unpack_call(call)
                     self._send_command(command_name, pos_args, kw_args)
                     # Receiving the return form and putting it into the list
-                    receiver = FormReceiverThread(self.connection, self.separation)
-                    receiver.start()
-                    response = receiver.receive_form()
+                    receiver = FormReceiver(self.connection, self.separation)
+                    response = receiver.receive()
 
                     # Adding the response to the response dict with the call id as the key
                     self.response_dict[call_id] = response
@@ -1276,7 +1465,7 @@ class CommandingClient(CommandingBase):
         Returns:
         The bool value of whether or not the response to the call correlating to the call id has already been received
         """
-        return call_id in self.response_dict.keys()
+        return call_id in self.response_dict
 
     def unpack_call(self, call_tuple):
         """
@@ -1359,12 +1548,14 @@ class CommandingClient(CommandingBase):
 
     def update_last_activity_time(self):
         """
-        This method simply assignes the current timestamp of the time module to the attribute that monitors the
+        This method simply assignes the current timestamp of the monotonic clock to the attribute that monitors the
         last activity. Also resets the idle time counter
+        Notes:
+            The timestamp is only used to calculate the idle time, thus it is not related to the system time
         Returns:
         void
         """
-        self.last_activity_timestamp = time.time()
+        self.last_activity_timestamp = time.monotonic()
         self.idle_time = 0
 
     def procure_random_int_list(self, length, a=100, b=10000):
@@ -1421,9 +1612,11 @@ class CommandingClient(CommandingBase):
         form = CommandForm("time")
         transmitter = FormTransmitterThread(connection, form, separation=separation, timeout=timeout)
         transmitter.start()
-        receiver = FormReceiverThread(connection, separation=separation, timeout=timeout)
-        receiver.start()
-        receiver.receive_form()
+        # The transmitter receives the acks over the same connection, thus only one of them may use it at a time
+        transmitter.join()
+        transmitter.raise_exception()
+        receiver = FormReceiver(connection, separation=separation, timeout=timeout)
+        receiver.receive()
 
     def _send_command(self, command_name, pos_args, kw_args):
         """
@@ -1,15 +1,19 @@
+from network.protocol.commanding import CommandingForm
 from network.protocol.commanding import CommandForm
 from network.protocol.commanding import ReturnForm
 from network.protocol.commanding import ErrorForm
 from network.protocol.commanding import CommandContext
 from network.protocol.commanding import CommandingHandler
 from network.protocol.commanding import CommandingClient
+from network.protocol.commanding import EXCEPTION_CLASSES
+from network.protocol.commanding import register_exception
 
 from network.form import Form
 
 from network.test.util import connections
 
 import unittest
+import unittest.mock
 import time
 
 
@@ -44,7 +48,7 @@ class TestCommandForm(unittest.TestCase):
         form = self.basic_form
 
         # Creating the command form from the form
-        command_form = CommandForm(form)
+        command_form = CommandForm.from_form(form)
 
         # Testing if the form attribute was correctly assigned
         self.assertEqual(command_form.form, form)
@@ -74,8 +78,7 @@ class TestCommandForm(unittest.TestCase):
         """
         # Creating the body and appendix from the class variables specifying the basic command
         name = self.basic_command_name
-        pos_count = len(self.basic_pos_args)
-        body = ["error:reply", "return:reply", "command:{}".format(name), "pos_args:{}".format(str(pos_count))]
+        body = ["command:{}".format(name), "return_mode:reply", "error_mode:reply"]
         appendix = {"pos_args": self.basic_pos_args, "kw_args": self.basic_kw_args}
 
         # Creating the form object from the title, body and appendix & returning that
@@ -110,7 +113,7 @@ class TestReturnForm(unittest.TestCase):
         """
         # Creating the ReturnForm from the Form object
         form = self.basic_form
-        return_form = ReturnForm(form)
+        return_form = ReturnForm.from_form(form)
 
         # Testing if the form is still the same as attribute
         self.assertEqual(return_form.form, form)
@@ -136,7 +139,7 @@ class TestReturnForm(unittest.TestCase):
         Returns:
         The Form object
         """
-        type_string = str(type(self.basic_return_value))
+        type_string = type(self.basic_return_value).__name__
         body = ["type:{}".format(type_string)]
         appendix = {"return": self.basic_return_value}
 
@@ -145,6 +148,143 @@ class TestReturnForm(unittest.TestCase):
         return form
 
 
+class TestCommandingForm(unittest.TestCase):
+
+    def test_form_title(self):
+        """
+        Testing if only the trailing "Form" of the class name is removed for the title of the forms
+        Returns:
+        void
+        """
+        self.assertEqual(CommandForm.FORM_TITLE, "COMMAND")
+
+        class FormatCommandForm(CommandForm):
+            pass
+
+        self.addCleanup(CommandingForm.FORM_CLASSES.pop, "FORMATCOMMAND")
+        self.assertEqual(FormatCommandForm.FORM_TITLE, "FORMATCOMMAND")
+        self.assertIs(CommandingForm.FORM_CLASSES["FORMATCOMMAND"], FormatCommandForm)
+
+
+class TestCommandContext(unittest.TestCase):
+
+    def test_commands_table(self):
+        """
+        Testing if the commands of the class and its parents are collected in the table, but no other attributes
+        Returns:
+        void
+        """
+        class Context(CommandContext):
+            command_label = "label"
+
+            def command_add(self, a, b):
+                return a + b
+
+        self.assertIn("add", Context.COMMANDS)
+        self.assertIn("time", Context.COMMANDS)
+        self.assertNotIn("label", Context.COMMANDS)
+        self.assertEqual(Context().lookup_command("add")(1, 2), 3)
+
+    def test_unknown_command(self):
+        """
+        Testing if looking up a command, that is no method, raises an AttributeError and is not cached
+        Returns:
+        void
+        """
+        class Context(CommandContext):
+            command_label = "label"
+
+        context = Context()
+        self.assertRaises(AttributeError, context.lookup_command, "label")
+        self.assertRaises(AttributeError, context.lookup_command, "missing")
+        self.assertNotIn("label", Context.COMMANDS)
+
+        # Commands of the object itself are used, but do not end up in the table of the class
+        context.command_double = lambda a: 2 * a
+        self.assertEqual(context.lookup_command("double")(2), 4)
+        self.assertNotIn("double", Context.COMMANDS)
+
+    def test_patched_command(self):
+        """
+        Testing if a command method, that is replaced after the class was created, is used by the lookup
+        Returns:
+        void
+        """
+        class Context(CommandContext):
+
+            def command_add(self, a, b):
+                return a + b
+
+        class SubContext(Context):
+            pass
+
+        context = SubContext()
+        with unittest.mock.patch.object(Context, "command_add", return_value=5):
+            self.assertEqual(context.lookup_command("add")(1, 2), 5)
+        self.assertEqual(context.lookup_command("add")(1, 2), 3)
+
+        # Assigning a new command to the parent class after the sub class was created
+        Context.command_multiply = lambda self, a, b: a * b
+        self.assertEqual(context.lookup_command("multiply")(2, 3), 6)
+        del Context.command_multiply
+        self.assertNotIn("multiply", SubContext.COMMANDS)
+
+
+class TestErrorForm(unittest.TestCase):
+
+    def test_builtin_exception(self):
+        """
+        Testing if a built in exception is recreated as an object of its class
+        Returns:
+        void
+        """
+        form = ErrorForm(ValueError("The value is wrong")).form
+        error_form = ErrorForm.from_form(form)
+        self.assertIsInstance(error_form.exception, ValueError)
+        self.assertEqual(str(error_form.exception), "The value is wrong")
+
+    def test_registered_exception(self):
+        """
+        Testing if a custom exception, which was registered, is recreated as an object of its own class
+        Returns:
+        void
+        """
+        class CustomError(Exception):
+            pass
+
+        self.assertIs(register_exception(CustomError), CustomError)
+        self.addCleanup(EXCEPTION_CLASSES.pop, "CustomError")
+        self.assertRaises(TypeError, register_exception, SystemExit)
+
+        form = ErrorForm(CustomError("The custom message")).form
+        error_form = ErrorForm.from_form(form)
+        self.assertIs(type(error_form.exception), CustomError)
+        self.assertEqual(str(error_form.exception), "The custom message")
+
+    def test_exception_table(self):
+        """
+        Testing if the exceptions, which are not subclasses of Exception, are not part of the exception table
+        Returns:
+        void
+        """
+        self.assertIn("ValueError", EXCEPTION_CLASSES)
+        for name in ("SystemExit", "KeyboardInterrupt", "GeneratorExit", "BaseException"):
+            self.assertNotIn(name, EXCEPTION_CLASSES)
+
+    def test_fallback_exception(self):
+        """
+        Testing if a plain Exception with the name and the message is created, in case the name is unknown or the
+        exception class needs more arguments than the message
+        Returns:
+        void
+        """
+        for name in ("UnknownError", "UnicodeDecodeError", "SystemExit"):
+            form = Form("ERROR", ["name:" + name, "message:The message"], {})
+            error_form = ErrorForm.from_form(form)
+            self.assertIs(type(error_form.exception), Exception)
+            self.assertEqual(str(error_form.exception), name + ": The message")
+
+
 class TestCommandingProtocol(unittest.TestCase):
 
     def test_basic_exchange(self):
@@ -156,14 +296,32 @@ class TestCommandingProtocol(unittest.TestCase):
         command_context = CommandContext()
         command_handler = CommandingHandler(conn1, command_context)
 
-        # Creating the CommandingClient and starting all the Threads
+        # Creating the CommandingClient and starting all the Threads. The threads are daemons and are stopped by the
+        # cleanups, so that a failing exchange can not keep the test process from exiting
         command_client = CommandingClient(conn2, command_context, queue_size=100)
+        command_handler.daemon = True
+        command_client.daemon = True
         command_handler.start()
         command_client.start()
+        self.addCleanup(self._stop, command_handler, command_client)
 
         return_value = command_client.execute_command("time", [], {})
         self.assertIsInstance(return_value, float)
 
-        command_handler.stop()
+    @staticmethod
+    def _stop(command_handler, command_client):
+        """
+        This method stops the handler and the client and waits for their threads to finish
+        Args:
+            command_handler: The started CommandingHandler
+            command_client: The started CommandingClient
+
+        Returns:
+        void
+        """
         command_client.running = False
+        command_handler.stop()
+        command_client.connection.sock.close()
+        command_handler.join(1)
+        command_client.join(1)
 
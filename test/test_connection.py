@@ -0,0 +1,364 @@
+from network.connection import SocketWrapper
+
+from network.test.util import connections
+from network.test.util import make_connected_pair
+from network.test.util import open_port
+
+import unittest
+import socket
+import threading
+import time
+
+
+class TestSocketConnection(unittest.TestCase):
+
+    def setUp(self):
+        self.conn1, self.conn2 = connections()
+
+    def tearDown(self):
+        self.conn1.sock.close()
+        self.conn2.sock.close()
+
+    def test_receive_line_buffered(self):
+        """
+        Testing if multiple lines sent at once are being received as individual lines and that nothing after the
+        break character gets lost
+        Returns:
+        void
+        """
+        self.conn1.sendall_string("first line\nsecond line\nrest")
+
+        self.assertEqual(self.conn2.receive_line(1), "first line")
+        self.assertEqual(self.conn2.wait_string_until_character("\n"), "second line")
+        self.assertEqual(self.conn2.receive_length_string(4, 1), "rest")
+
+    def test_receive_long_line(self):
+        """
+        Testing the reception of a line, that is a lot longer than a single receive chunk
+        Returns:
+        void
+        """
+        line = "This is a long line " * 1000
+        self.conn1.sendall_string(line + "\n")
+
+        self.assertEqual(self.conn2.receive_line(1), line)
+
+    def test_receive_length_after_line(self):
+        """
+        Testing if a length of bytes can be received correctly, when a part of it has already been buffered by the
+        reception of a line
+        Returns:
+        void
+        """
+        data = bytes(range(256)) * 100
+        self.conn1.sendall_bytes(b"header\n" + data)
+
+        self.assertEqual(self.conn2.receive_line(1), "header")
+        self.assertEqual(self.conn2.receive_length_bytes(len(data), 1), data)
+
+    def test_frame(self):
+        """
+        Testing if frames are received with the exact payload, even if they follow each other directly
+        Returns:
+        void
+        """
+        payload = b"frame\npayload" * 1000
+        self.conn1.sendall_frame(payload)
+        self.conn1.sendall_frame(b"")
+        self.conn1.sendall_frame(b"last")
+
+        self.assertEqual(self.conn2.receive_frame(1), payload)
+        self.assertEqual(self.conn2.receive_frame(1), b"")
+        self.assertEqual(self.conn2.receive_frame(1), b"last")
+
+    def test_frame_iov(self):
+        """
+        Testing if a frame sent from multiple buffers is received as one payload
+        Returns:
+        void
+        """
+        self.conn1.sendall_frame_iov([b"first", b"\n", b"second" * 1000])
+
+        self.assertEqual(self.conn2.receive_frame(1), b"first\n" + b"second" * 1000)
+
+    def test_frame_iov_prefix_suffix(self):
+        """
+        Testing if the unframed prefix and suffix are sent in front of and after the frame
+        Returns:
+        void
+        """
+        self.conn1.sendall_frame_iov([b"payload"], prefix=[b"line\n"], suffix=[b"rest"])
+
+        self.assertEqual(self.conn2.receive_line(1), "line")
+        self.assertEqual(self.conn2.receive_frame(1), b"payload")
+        self.assertEqual(self.conn2.receive_length_bytes(4, 1), b"rest")
+
+    def test_frame_max_size(self):
+        """
+        Testing if a frame, which exceeds the max size, is being rejected
+        Returns:
+        void
+        """
+        self.conn1.sendall_frame(b"x" * 100)
+
+        with self.assertRaises(OverflowError):
+            self.conn2.receive_frame(1, max_size=10)
+
+    def test_receive_timeout(self):
+        """
+        Testing if a TimeoutError is raised, in case no data arrives within the timeout
+        Returns:
+        void
+        """
+        self.conn1.sendall_string("no line break")
+
+        with self.assertRaises(TimeoutError):
+            self.conn2.receive_line(0.05)
+        # The data, that was already received has to remain in the buffer
+        self.conn1.sendall_string("\n")
+        self.assertEqual(self.conn2.receive_line(1), "no line break")
+
+    def test_receive_eof(self):
+        """
+        Testing if an EOFError is raised in case the connection is closed before all the data was received
+        Returns:
+        void
+        """
+        self.conn1.sendall_bytes(b"abc")
+        self.conn1.sock.close()
+
+        with self.assertRaises(EOFError):
+            self.conn2.receive_length_bytes(10, 1)
+
+    def test_receive_line_eof(self):
+        """
+        Testing if an EOFError is raised in case the connection is closed before the line break was received
+        Returns:
+        void
+        """
+        self.conn1.sendall_bytes(b"abc")
+        self.conn1.sock.close()
+
+        with self.assertRaises(EOFError):
+            self.conn2.receive_line(1)
+
+    def test_receive_length_ascii(self):
+        """
+        Testing the reception of an ascii length header, which arrives in multiple parts, is followed by other data,
+        contains non ascii bytes or ends early
+        Returns:
+        void
+        """
+        # The second part of the header is sent later on, so the first recv call only returns a part of it
+        self.conn1.sendall_bytes(b"00")
+        timer = threading.Timer(0.05, self.conn1.sendall_bytes, args=(b"42rest",))
+        timer.start()
+        self.addCleanup(timer.join)
+        self.assertEqual(self.conn2.receive_length_ascii(4, 1), "0042")
+        self.assertEqual(self.conn2.receive_length_bytes(4, 1), b"rest")
+
+        # A header with bytes, that are no ascii characters is no valid length specification
+        self.conn1.sendall_bytes(b"1\xff")
+        with self.assertRaises(UnicodeDecodeError):
+            self.conn2.receive_length_ascii(2, 1)
+
+        self.conn1.sendall_bytes(b"12")
+        self.conn1.sock.close()
+        with self.assertRaises(EOFError):
+            self.conn2.receive_length_ascii(4, 1)
+
+    def test_receive_into(self):
+        """
+        Testing if the data is received into the given buffer, also if a part of it was already buffered
+        Returns:
+        void
+        """
+        data = bytes(range(256)) * 10
+        self.conn1.sendall_bytes(b"line\n" + data)
+        self.assertEqual(self.conn2.receive_line(1), "line")
+
+        buffer = bytearray(len(data))
+        self.conn2.receive_into(buffer, 1)
+        self.assertEqual(buffer, data)
+
+    def test_receive_until_split_character(self):
+        """
+        Testing if a multi byte break character is found, even if it is split between two received chunks
+        Returns:
+        void
+        """
+        self.conn2.chunk_size = 4
+        self.conn1.sendall_string("abc\u00e9rest")
+
+        self.assertEqual(self.conn2.receive_string_until_character("\u00e9", 1), "abc")
+        self.assertEqual(self.conn2.receive_length_string(4, 1), "rest")
+
+
+class TestConnectedPair(unittest.TestCase):
+
+    def test_init(self):
+        """
+        Testing if a pair of connected blocking TCP sockets is returned
+        Returns:
+        void
+        """
+        connection, connector = make_connected_pair(open_port())
+        try:
+            self.assertIsNotNone(connection)
+            self.assertIsNotNone(connector)
+            self.assertTrue(connector.getblocking())
+            connector.sendall(b"test")
+            self.assertEqual(connection.recv(4), b"test")
+        finally:
+            connection.close()
+            connector.close()
+
+
+class TestSocketWrapper(unittest.TestCase):
+
+    def setUp(self):
+        sock1, sock2 = socket.socketpair()
+        self.sock = sock1
+        self.wrapper = SocketWrapper(sock2, True)
+
+    def tearDown(self):
+        self.sock.close()
+        if self.wrapper.sock is not None:
+            self.wrapper.sock.close()
+
+    def test_receive_until_include(self):
+        """
+        Testing if the break character is only returned with the include flag, but removed from the buffer either way
+        Returns:
+        void
+        """
+        self.sock.sendall(b"first\nsecond\n")
+
+        self.assertEqual(self.wrapper.receive_until_character(b"\n", 100, 1, include=True), b"first\n")
+        self.assertEqual(self.wrapper.receive_until_character(ord("\n"), 100, 1), b"second")
+
+    def test_receive_until_limit(self):
+        """
+        Testing if an OverflowError is raised, in case the break character does not occur within the limit
+        Returns:
+        void
+        """
+        self.sock.sendall(b"x" * 100 + b"\n")
+
+        with self.assertRaises(OverflowError):
+            self.wrapper.receive_line(10, 1)
+
+    def test_receive_line_buffered(self):
+        """
+        Testing if the data after the break character is kept in the buffer for the following calls
+        Returns:
+        void
+        """
+        self.sock.sendall(b"first\nsecond\nrest")
+
+        self.assertEqual(self.wrapper.receive_line(100, 1), b"first")
+        self.assertEqual(self.wrapper.receive_line(100, 1), b"second")
+        self.assertEqual(self.wrapper.receive_length(4, 1), b"rest")
+
+    def test_receive_length_partly_buffered(self):
+        """
+        Testing if a length is received correctly, when a part of it is already in the buffer and the rest still has
+        to be received from the socket
+        Returns:
+        void
+        """
+        data = bytes(range(256)) * 100
+        self.sock.sendall(b"line\n" + data[:10])
+        self.assertEqual(self.wrapper.receive_line(100, 1), b"line")
+        self.sock.sendall(data[10:])
+
+        self.assertEqual(self.wrapper.receive_length(len(data), 1), data)
+
+    def test_release_socket(self):
+        """
+        Testing if the buffered data of the socket is dropped, when the socket is released
+        Returns:
+        void
+        """
+        self.sock.sendall(b"line\nrest")
+        self.wrapper.receive_line(100, 1)
+
+        sock = self.wrapper.release_socket()
+        sock.close()
+        self.assertEqual(len(self.wrapper._rbuf), 0)
+
+    def test_reconnect_buffer(self):
+        """
+        Testing if the data buffered from a previous connection is not returned after connecting to another server
+        Returns:
+        void
+        """
+        servers = []
+        for _ in range(2):
+            server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            server.bind(("127.0.0.1", 0))
+            server.listen(1)
+            servers.append(server)
+        wrapper = SocketWrapper(socket.socket(socket.AF_INET, socket.SOCK_STREAM), False)
+        try:
+            wrapper.connect("127.0.0.1", servers[0].getsockname()[1], 3, 0.001)
+            connection, _ = servers[0].accept()
+            connection.sendall(b"old1\nold2\n")
+            connection.close()
+            self.assertEqual(wrapper.receive_line(100, 1), b"old1")
+
+            # The connected socket is replaced before the first attempt, no attempt fails and no delay is waited
+            first_sock = wrapper.sock
+            start = time.monotonic()
+            wrapper.connect("127.0.0.1", servers[1].getsockname()[1], 2, 10)
+            self.assertLess(time.monotonic() - start, 5)
+            self.assertIsNot(wrapper.sock, first_sock)
+            connection, _ = servers[1].accept()
+            connection.sendall(b"new\n")
+            connection.close()
+            self.assertEqual(wrapper.receive_line(100, 1), b"new")
+        finally:
+            wrapper.sock.close()
+            for server in servers:
+                server.close()
+
+    def test_connect_retry(self):
+        """
+        Testing if the wrapper connects with a later attempt, after the first attempts were refused
+        Returns:
+        void
+        """
+        # Getting a free port by binding to port 0, the server only starts listening after a while
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.bind(("127.0.0.1", 0))
+        port = server.getsockname()[1]
+        timer = threading.Timer(0.05, server.listen)
+        timer.start()
+
+        wrapper = SocketWrapper(socket.socket(socket.AF_INET, socket.SOCK_STREAM), False)
+        try:
+            wrapper.connect("127.0.0.1", port, 10, 0.01)
+            self.assertTrue(wrapper.connected)
+        finally:
+            timer.join()
+            wrapper.sock.close()
+            server.close()
+
+    def test_connect_refused(self):
+        """
+        Testing if a ConnectionRefusedError is raised after all the attempts have failed
+        Returns:
+        void
+        """
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.bind(("127.0.0.1", 0))
+        port = server.getsockname()[1]
+
+        wrapper = SocketWrapper(socket.socket(socket.AF_INET, socket.SOCK_STREAM), False)
+        try:
+            with self.assertRaises(ConnectionRefusedError):
+                wrapper.connect("127.0.0.1", port, 3, 0.001)
+            self.assertFalse(wrapper.connected)
+        finally:
+            wrapper.sock.close()
+            server.close()
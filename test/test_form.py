@@ -5,10 +5,26 @@ project.
 from network.form import AppendixEncoder
 from network.form import PickleAppendixEncoder
 from network.form import JsonAppendixEncoder
+from network.form import MsgpackAppendixEncoder
+from network.form import msgpack
+from network.form import numpy
+from network.form import ijson
+from network.form import simdjson
+from network.form import StreamReader
 
 from network.form import Form
+from network.form import FormTransmitterThread
+from network.form import FormReceiverThread
+from network.form import ACK
+
+from network.test.util import connections
+from network.test.util import chunk_read
 
 import unittest
+import unittest.mock
+import io
+import math
+import pickle
 
 
 class TestEncoder(unittest.TestCase):
@@ -46,6 +62,20 @@ class TestEncoder(unittest.TestCase):
         is_able = encoder.is_serializable(obj)
         self.assertTrue(is_able)
 
+    def _test_encode_into(self, encoder, obj):
+        """
+        This method encodes the given object into a BytesIO and tests if the written bytes decode to the original
+        Args:
+            encoder: The AppendixEncoder subclass to use
+            obj: The object to encode
+
+        Returns:
+        void
+        """
+        writer = io.BytesIO()
+        encoder.encode_into(obj, writer)
+        self.assertEqual(encoder.decode(writer.getvalue()), obj)
+
     def _test_encode(self, encoder, obj):
         """
         This method encodes the given object, tests if this encoded version is really a bytes type and then test if
@@ -104,6 +134,113 @@ class TestJsonAppendixEncoder(TestEncoder):
         test_dict = {"hallo": ["hallo, 12"], "Wort": {"hallo": []}}
         self._test(self.encoder, test_dict)
 
+    def test_not_serializable(self):
+        self.assertFalse(self.encoder.is_serializable({"hallo": [1, {2, 3}]}))
+        self.assertFalse(self.encoder.is_serializable(complex(1, 2)))
+
+    def test_encode_into(self):
+        test_dict = {"hallo": ["hallo, 12"], "Wort": {"hallo": [1.5, None, True]}}
+        self._test_encode_into(self.encoder, test_dict)
+
+    def test_decode_memoryview(self):
+        test_dict = {"hallo": ["hallo, 12"], "Wort": {"hallo": []}}
+        encoded = self.encoder.encode(test_dict)
+        self.assertDictEqual(self.encoder.decode(memoryview(encoded)), test_dict)
+
+    def test_decode_empty(self):
+        self.assertListEqual(self.encoder.decode(b"  "), [])
+
+    def test_decode_stream(self):
+        test_dict = {"hallo": ["hallo, 12"], "Wort": {"hallo": [1.5]}}
+        encoded = self.encoder.encode(test_dict)
+        stream = io.BytesIO(encoded + b"rest")
+        self.assertDictEqual(self.encoder.decode_stream(stream.read, len(encoded)), test_dict)
+        self.assertEqual(stream.read(), b"rest")
+
+    def test_encode_exact(self):
+        # Big integers, NaN and infinite floats have to be decoded exactly, no matter which json libraries are used
+        test_dict = {"big": 2 ** 70, "nan": float("nan"), "inf": [float("inf"), -float("inf")], "none": None}
+        encoded = self.encoder.encode(test_dict)
+        decoded = self.encoder.decode(encoded)
+        self.assertEqual(decoded["big"], 2 ** 70)
+        self.assertIsInstance(decoded["big"], int)
+        self.assertTrue(math.isnan(decoded["nan"]))
+        self.assertListEqual(decoded["inf"], [float("inf"), -float("inf")])
+        self.assertIsNone(decoded["none"])
+        # The json written by other peers might contain them as well
+        self.assertEqual(self.encoder.decode(b"[18446744073709551616, 1]"), [2 ** 64, 1])
+        writer = io.BytesIO()
+        self.encoder.encode_into({"nan": float("nan")}, writer)
+        self.assertTrue(math.isnan(self.encoder.decode(writer.getvalue())["nan"]))
+
+    @unittest.skipIf(simdjson is None, "simdjson is not installed")
+    def test_decode_simdjson(self):
+        # Without orjson the decoding is done by simdjson, which hands big integers and empty strings to the json module
+        test_dict = {"hallo": [1, {"nested": [1.5, None, True, "text"]}], "big": 2 ** 70, "Wort": {}}
+        encoded = self.encoder.encode(test_dict)
+        with unittest.mock.patch("network.form.orjson", None):
+            self.assertDictEqual(self.encoder.decode(encoded), test_dict)
+            self.assertDictEqual(self.encoder.decode(memoryview(encoded)), test_dict)
+            self.assertListEqual(self.encoder.decode(b"  "), [])
+            self.assertEqual(self.encoder.decode(b"[1, [2, [3]]]"), [1, [2, [3]]])
+            with self.assertRaises(ValueError):
+                self.encoder.decode(b"{bad")
+
+    def test_decode_stream_chunks(self):
+        test_dict = {"hallo": ["hallo, 12"], "Wort": {"hallo": [1.5, 2, None]}}
+        encoded = self.encoder.encode(test_dict)
+        stream = io.BytesIO(encoded + b"rest")
+        self.assertDictEqual(self.encoder.decode_stream(chunk_read(stream, 5), len(encoded)), test_dict)
+        self.assertEqual(stream.read(), b"rest")
+
+    @unittest.skipIf(ijson is None, "ijson is not installed")
+    def test_decode_stream_ijson(self):
+        # The stream is bigger than the chunks ijson reads, the numbers have to be decoded as int and float
+        test_dict = {str(i): {"int": i, "float": i + 0.5, "list": [True, None, "text"]} for i in range(5000)}
+        encoded = self.encoder.encode(test_dict)
+        stream = io.BytesIO(encoded)
+        decoded = self.encoder.decode_stream(chunk_read(stream, 1000), len(encoded))
+        self.assertDictEqual(decoded, test_dict)
+        self.assertIsInstance(decoded["10"]["float"], float)
+        self.assertIsInstance(decoded["10"]["int"], int)
+
+    def test_decode_stream_trailing_whitespace(self):
+        # The whitespaces after the object are more than ijson reads at once, they still have to be read completely
+        test_dict = {str(i): [i, "text"] for i in range(1000)}
+        encoded = self.encoder.encode(test_dict) + b" " * 200000
+        stream = io.BytesIO(encoded + b"rest")
+        self.assertDictEqual(self.encoder.decode_stream(chunk_read(stream, 1000), len(encoded)), test_dict)
+        self.assertEqual(stream.read(), b"rest")
+
+    def test_decode_stream_trailing_data(self):
+        for encoded in (b'{"a": 1} x', b'{"a": 1} {"b": 2}', b'{"a": 1}' + b" " * 100000 + b"x"):
+            stream = io.BytesIO(encoded)
+            with self.assertRaises(ValueError):
+                self.encoder.decode_stream(chunk_read(stream, 1000), len(encoded))
+
+
+class TestStreamReader(unittest.TestCase):
+
+    def test_read_all_chunks(self):
+        # Reading everything has to collect all the chunks, even if the read function returns less
+        stream = io.BytesIO(b"0123456789rest")
+        reader = StreamReader(chunk_read(stream, 3), 10)
+        self.assertEqual(reader.read(), b"0123456789")
+        self.assertEqual(reader.read(), b"")
+        self.assertEqual(stream.read(), b"rest")
+
+    def test_read_size(self):
+        stream = io.BytesIO(b"0123456789")
+        reader = StreamReader(stream.read, 6)
+        self.assertEqual(reader.read(4), b"0123")
+        self.assertEqual(reader.read(4), b"45")
+        self.assertEqual(reader.read(4), b"")
+
+    def test_read_eof(self):
+        reader = StreamReader(chunk_read(io.BytesIO(b"01234"), 3), 10)
+        with self.assertRaises(EOFError):
+            reader.read()
+
 
 class TestPickleAppendixEncoder(TestEncoder):
 
@@ -145,6 +282,45 @@ class TestPickleAppendixEncoder(TestEncoder):
         test_complex = complex(1, 2)
         self._test(self.encoder, test_complex)
 
+    def test_encode_into(self):
+        test_dict = {"hallo": ["hallo, 12"], "Wort": {"hallo": complex(1, 2)}}
+        self._test_encode_into(self.encoder, test_dict)
+
+    def test_encode_out_of_band(self):
+        test_dict = {"hallo": pickle.PickleBuffer(bytearray(b"buffer" * 1000)), "Wort": [1, 2]}
+        buffers = self.encoder.encode_buffers(test_dict)
+        self.assertGreater(len(buffers), 1)
+        decoded = self.encoder.decode(b''.join(buffers))
+        self.assertEqual(bytes(decoded["hallo"]), b"buffer" * 1000)
+        self.assertListEqual(decoded["Wort"], [1, 2])
+
+    def test_decode_stream(self):
+        test_dict = {"hallo": ["hallo, 12"], "Wort": {"hallo": complex(1, 2)}}
+        encoded = self.encoder.encode(test_dict)
+        stream = io.BytesIO(encoded)
+        self.assertDictEqual(self.encoder.decode_stream(chunk_read(stream, 7), len(encoded)), test_dict)
+
+
+@unittest.skipIf(msgpack is None, "msgpack is not installed")
+class TestMsgpackAppendixEncoder(TestEncoder):
+
+    encoder = MsgpackAppendixEncoder
+
+    def test_encode_string(self):
+        test_string = "Hallo"
+        self._test(self.encoder, test_string)
+
+    def test_encode_list(self):
+        test_list = ["hallo", 1748, 87.927]
+        self._test(self.encoder, test_list)
+
+    def test_encode_dict(self):
+        test_dict = {"hallo": ["hallo, 12"], "Wort": {"hallo": []}, 12: b"bytes"}
+        self._test(self.encoder, test_dict)
+
+    def test_decode_empty(self):
+        self.assertListEqual(self.encoder.decode(b""), [])
+
 
 # Testing the form class
 
@@ -154,10 +330,23 @@ class TestForm(unittest.TestCase):
     std_body = ["line one", "line two", "line three"]
     std_appendix = {"Hallo": 12.1, "Nein": 11.2}
 
+    @classmethod
+    def setUpClass(cls):
+        # The long appendix is only built once for all the tests, which use it
+        cls.long_appendix = {
+            str(i): ["This is a long string to make matters worse and then the square", i**2] for i in range(1000)
+        }
+
     def test_init(self):
         form = self._create_std_form()
         self._test_std_form(form)
 
+    def test_init_error(self):
+        with self.assertRaises(ValueError):
+            Form(self.std_title, 12, self.std_appendix)
+        with self.assertRaises(ValueError):
+            Form(self.std_title, self.std_body, b"{hallo")
+
     def test_long_title(self):
         title = "HEAD" * 1000
         form = Form(title, self.std_body, self.std_appendix)
@@ -168,12 +357,42 @@ class TestForm(unittest.TestCase):
         form = Form(self.std_title, body, self.std_appendix)
         self._test_body(form, body)
 
+    def test_number_body(self):
+        body = list(range(1, 10000))
+        form = Form(self.std_title, body, self.std_appendix)
+        self.assertEqual(form.body, "\n".join(map(str, body)))
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy_body(self):
+        body = numpy.arange(1, 10000)
+        form = Form(self.std_title, body, self.std_appendix)
+        self.assertEqual(form.body, "\n".join(map(str, range(1, 10000))))
+
     def test_long_appendix(self):
-        appendix = {}
-        for i in range(1000):
-            appendix[i] = ["This is a long string to make matters worse and then the square", i**2]
-        form = Form(self.std_title, self.std_body, appendix)
-        self._test_appendix(form, appendix)
+        form = Form(self.std_title, self.std_body, self.long_appendix)
+        self._test_appendix(form, self.long_appendix)
+
+    def test_appendix_encoded_round_trip(self):
+        form = Form(self.std_title, self.std_body, self.long_appendix)
+        # A form created from the encoded bytes has to decode them to an equal appendix again
+        decoded_form = Form(self.std_title, self.std_body, form.appendix_encoded)
+        self._test_appendix(decoded_form, self.long_appendix)
+
+    def test_appendix_encoded_cached(self):
+        form = self._create_std_form()
+        # The encoded appendix is only joined once
+        self.assertIs(form.appendix_encoded, form.appendix_encoded)
+        # Assigning a new appendix has to replace the encoded appendix as well
+        form.appendix = {"Hallo": 1}
+        self.assertEqual(form.appendix_encoded, JsonAppendixEncoder.encode({"Hallo": 1}))
+        self.assertEqual(form.appendix_length, len(form.appendix_encoded))
+
+    def test_slots(self):
+        # Plain forms do not have an instance dict, all the attributes are slots
+        form = self._create_std_form()
+        self.assertFalse(hasattr(form, "__dict__"))
+        with self.assertRaises(AttributeError):
+            form.unknown = None
 
     def test_empty_standard(self):
         # Checking for the correct behaviour in the standard case
@@ -201,6 +420,8 @@ class TestForm(unittest.TestCase):
         # Checking for whitespace title
         form = Form("     ", self.std_body, self.std_appendix)
         self.assertFalse(form.valid)
+        form = Form(" \t ", self.std_body, self.std_appendix)
+        self.assertFalse(form.valid)
         # Checking for empty
         form = Form(self.std_title, [], {})
         self.assertFalse(form.valid)
@@ -218,6 +439,30 @@ class TestForm(unittest.TestCase):
         form1 = Form(self.std_title, ["hallo"], self.std_appendix)
         form2 = Form(self.std_title, ["allo"], self.std_appendix)
         self.assertNotEqual(form1, form2)
+        # Checking for different appendices
+        form1 = Form(self.std_title, self.std_body, {"Hallo": 1})
+        form2 = Form(self.std_title, self.std_body, {"Hallo": 2})
+        self.assertNotEqual(form1, form2)
+        # Checking for equal appendices, whose encoded versions differ
+        form1 = Form(self.std_title, self.std_body, {"Hallo": 1, "Nein": 2})
+        form2 = Form(self.std_title, self.std_body, {"Nein": 2, "Hallo": 1})
+        self.assertEqual(form1, form2)
+
+    def test_from_trusted(self):
+        form = self._create_std_form()
+        trusted_form = Form.from_trusted(form.title, form.body, form.appendix_encoded)
+        self._test_std_form(trusted_form)
+        self.assertEqual(trusted_form.appendix_length, form.appendix_length)
+
+    def test_from_trusted_buffer(self):
+        form = self._create_std_form()
+        # A receive buffer is decoded as it is and only turned into bytes, once the encoded appendix is requested
+        buffer = bytearray(form.appendix_encoded)
+        trusted_form = Form.from_trusted(form.title, form.body, buffer)
+        self._test_std_form(trusted_form)
+        self.assertIs(trusted_form.appendix_buffers[0], buffer)
+        self.assertIsInstance(trusted_form.appendix_encoded, bytes)
+        self.assertEqual(trusted_form.appendix_encoded, form.appendix_encoded)
 
     def _create_std_form(self):
         """
@@ -283,4 +528,108 @@ class TestForm(unittest.TestCase):
 
 class TestFormTransmission(unittest.TestCase):
 
-    pass
\ No newline at end of file
+    separation = "$separation$"
+
+    def setUp(self):
+        self.connection1, self.connection2 = connections()
+
+    def tearDown(self):
+        self.connection1.sock.close()
+        self.connection2.sock.close()
+
+    def test_transmission(self):
+        form = Form("TITLE", ["first line", "", "third line"], {"Hallo": [1, 2, 3]})
+        received_form = self._transmit(form)
+        self.assertEqual(received_form, form)
+
+    def test_transmission_separation_in_body(self):
+        body = ["first line", self.separation + "12", "third line"]
+        form = Form("TITLE", body, {"Hallo": [1, 2, 3]})
+        received_form = self._transmit(form)
+        # The body is transmitted as it is, the separation string in the body does not collide
+        self.assertEqual(received_form.body, "\n".join(body))
+        self.assertEqual(received_form, form)
+
+    def test_transmission_separation_collision(self):
+        body = ["first line", self.separation + "12", "third " + self.separation]
+        form = Form("TITLE", body, {"Hallo": [1, 2, 3]})
+        with self.assertRaises(ValueError):
+            FormTransmitterThread(self.connection1, form, self.separation, adjust=False)
+        # The adjustment only changes the line, which starts with the separation string
+        FormTransmitterThread(self.connection1, form, self.separation, adjust=True)
+        self.assertEqual(form.body, "first line\n {0}12\nthird {0}".format(self.separation))
+
+    def test_transmission_pickle_buffers(self):
+        appendix = {"hallo": pickle.PickleBuffer(bytearray(b"buffer" * 1000))}
+        form = Form("TITLE", ["line"], appendix, appendix_encoder=PickleAppendixEncoder)
+        transmitter = FormTransmitterThread(self.connection1, form, self.separation, timeout=1)
+        transmitter.start()
+        self.assertEqual(self.connection2.receive_line(1), "TITLE")
+        self.connection2.sendall_bytes(ACK)
+        self.connection2.receive_frame(1)
+        self.connection2.sendall_bytes(ACK)
+        received = self.connection2.receive_length_bytes(form.appendix_length, 1)
+        self.connection2.sendall_bytes(ACK)
+        transmitter.join()
+        transmitter.raise_exception()
+        self.assertEqual(received, form.appendix_encoded)
+        self.assertEqual(bytes(PickleAppendixEncoder.decode(received)["hallo"]), b"buffer" * 1000)
+
+    def test_transmission_pipelined(self):
+        forms = [Form("TITLE{}".format(i), ["line"], {"Hallo": list(range(i))}) for i in range(3)]
+        transmitters = []
+        for form in forms:
+            transmitter = FormTransmitterThread(self.connection1, form, self.separation, timeout=1)
+            transmitters.append(transmitter)
+        # The next receiver is started as soon as the previous one has received its data, not when it is decoded
+        receivers = []
+        for transmitter in transmitters:
+            receiver = FormReceiverThread(self.connection2, self.separation, timeout=1)
+            receiver.start()
+            transmitter.start()
+            receiver.wait_received()
+            transmitter.join()
+            receivers.append(receiver)
+        for receiver, form in zip(receivers, forms):
+            self.assertEqual(receiver.receive_form(), form)
+
+    @unittest.skipIf(msgpack is None, "msgpack is not installed")
+    def test_transmission_msgpack(self):
+        appendix = {"Hallo": [1, 2, 3], "bytes": b"binary"}
+        form = Form("TITLE", ["line"], appendix, appendix_encoder=MsgpackAppendixEncoder)
+        received_form = self._transmit(form, MsgpackAppendixEncoder)
+        self.assertEqual(received_form, form)
+
+    def test_transmission_stream(self):
+        appendix = {str(i): [i, i + 0.5, "text"] for i in range(1000)}
+        form = Form("TITLE", ["line"], appendix)
+        received_form = self._transmit(form, stream_threshold=0)
+        self.assertEqual(received_form, form)
+        self.assertEqual(received_form.appendix_length, form.appendix_length)
+        self.assertEqual(received_form.appendix_encoded, form.appendix_encoded)
+
+    def test_transmission_empty_body(self):
+        form = Form("TITLE", [], {"Hallo": [1, 2, 3]})
+        received_form = self._transmit(form)
+        self.assertEqual(received_form, form)
+
+    def _transmit(self, form, appendix_encoder=JsonAppendixEncoder, stream_threshold=None):
+        """
+        This method transmits the given form from the first to the second connection and returns the received form
+        Args:
+            form: The Form object to transmit
+            appendix_encoder: The encoder class, with which the receiver decodes the appendix
+            stream_threshold: The min length of an appendix, which the receiver decodes while receiving it
+
+        Returns:
+        The received Form object
+        """
+        transmitter = FormTransmitterThread(self.connection1, form, self.separation, timeout=1)
+        receiver = FormReceiverThread(self.connection2, self.separation, timeout=1, appendix_encoder=appendix_encoder,
+                                      stream_threshold=stream_threshold)
+        receiver.start()
+        transmitter.start()
+        received_form = receiver.receive_form()
+        transmitter.join()
+        transmitter.raise_exception()
+        return received_form
\ No newline at end of file
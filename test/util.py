@@ -1,9 +1,10 @@
 from network.connection import SocketConnection
 
-import threading
-import random
+import selectors
 import socket
-import time
+
+# The size of the socket send and receive buffers used for the test connections
+SOCKET_BUFFER_SIZE = 1 << 20
 
 
 def open_port():
@@ -12,24 +13,32 @@ def open_port():
     Returns:
     the integer port number of the open port
     """
-    # Choosing the port random in the upper port range
-    port = random.randint(30000, 60000)
-    result = 0
-    while result == 0:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        address = ('127.0.0.1', port)
-        # attempting to connect to the server, in case not possible, there is no socket on the port -> port is free
-        result = sock.connect_ex(address)
-        port = random.randint(30000, 60000)
-    # Returning the found free port
+    # Binding to the port 0 lets the operating system choose a free port, which is then read from the socket
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(('127.0.0.1', 0))
+    port = sock.getsockname()[1]
+    sock.close()
     return port
 
 
+def chunk_read(stream, chunk_size):
+    """
+    This function returns a read function for the given stream, which returns at most chunk_size bytes per call
+    Args:
+        stream: The binary file like object to read from
+        chunk_size: The int max amount of bytes returned per call
+
+    Returns:
+    The read function
+    """
+    return lambda size: stream.read(min(size, chunk_size))
+
+
 def sockets(port=None):
     """
-    This function wraps the functionality of the SockGrab class, by returning a pair of connected sockets
+    This function returns a pair of connected TCP sockets on the given port
     Args:
-        port:
+        port: The int port for the connection or None to use any open port
 
     Returns:
     a tuple of connected sockets, where the first one is the one that was returned by the accepted server connection
@@ -39,76 +48,78 @@ def sockets(port=None):
     if port is None:
         port = open_port()
 
-    sock_grab = SockGrab(port)
-    sock_grab.start()
-    return sock_grab.sockets()
+    return make_connected_pair(port)
 
 
-def connections(port=None):
-    sock1, sock2 = sockets(port)
-    # Creating SocketConnection objects from these sockets
-    return SocketConnection(sock1), SocketConnection(sock2)
+def make_connected_pair(port):
+    """
+    This function opens a server socket at the given port, connects a second socket to it and returns the accepted
+    socket together with the connecting one. The connect is done non blocking and a selector waits for the
+    connection to arrive at the server socket, thus no thread is needed to accept it.
+    Args:
+        port: The int port for the server socket
 
+    Raises:
+        TimeoutError: In case the connection could not be accepted within one second
+    Returns:
+    a tuple of connected sockets, where the first one is the one that was returned by the accepted server connection
+    and the second one the actively requesting a connection
+    """
+    address = ('127.0.0.1', port)
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    connector = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    # The port can be bound again right away, even if a previous test connection on it is still in TIME_WAIT
+    server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    # The tests exchange a lot of small messages, which should not be delayed by the Nagle algorithm
+    connector.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    # Big buffers let the long test forms be sent without stalling the write. They are set before listening and
+    # connecting, since the TCP window scaling is negotiated with the handshake and the accepted socket inherits
+    # the buffer sizes of the server socket
+    for sock in (server, connector):
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
 
-class SockGrab(threading.Thread):
+    try:
+        server.bind(address)
+        server.listen(1)
+        connector.setblocking(False)
+        connector.connect_ex(address)
+        # The server socket becomes readable as soon as the connection is ready to be accepted
+        with selectors.DefaultSelector() as selector:
+            selector.register(server, selectors.EVENT_READ)
+            if not selector.select(1):
+                connector.close()
+                raise TimeoutError("Connection problems in testing")
+        connection, _ = server.accept()
+    finally:
+        server.close()
+    connector.setblocking(True)
+    return connection, connector
+
+
+def socket_pair():
     """
-    This is a utility class, which will open a server socket at the given port and then simply wait for the first
-    incoming connection and then assign the bound socket, which is the result of this first established connection to
-    the internal 'connection' attribute, where it can be grabbed for further use.
+    This function returns a pair of connected sockets, which are created by a single socketpair call, thus without a
+    server, a port or a thread. (On platforms without unix sockets, python creates the pair over the loopback)
+    Returns:
+    a tuple of two connected sockets
     """
-    def __init__(self, port):
-        threading.Thread.__init__(self)
-        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.address = ('127.0.0.1', port)
-        self.connector = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.connection = None
-
-    def run(self):
-        """
-        The main method of the Thread, which will be called after the Thread was started. This will simply define the
-        internal socket object as a server and wait for a connection, which it then assigns to the connection attribute
-        Returns:
-        void
-        """
-        self.sock.bind(self.address)
-        self.sock.listen(2)
-        self.connection, address = self.sock.accept()
-
-    def sockets(self):
-        """
-        This method returns the pair of connected sockets.
-        Returns:
-        The
-        """
-        # Connecting the connector
-        self.connect()
-        # Waiting for the corresponding socket was accepted in the server socket
-        self.get_connection()
-        return self.connection, self.connector
-
-    def get_connection(self):
-        """
-        This method is used to get the connected server socket from the Thread. The method will be blocking until the
-        connection attribute is assigned the connected socket from the server accepting or the timeout of waiting one
-        second has been exceeded
-        Raises:
-            TimeoutError: In case, that even one second after the method was called, the socket was sill not assigned
-                to the connection attribute of this object
-        Returns:
-        The socket object, that was given by the server for the established connection
-        """
-        start_time = time.time()
-        while self.connection is None:
-            delta = time.time() - start_time
-            if delta > 1:
-                raise TimeoutError("Connection problems in testing")
-        return self.connection
-
-    def connect(self):
-        """
-        This method will simply connect the internal connector socket to the server. Thus it has to be called only
-        after the Thread has been started
-        Returns:
-        void
-        """
-        self.connector.connect(self.address)
+    return socket.socketpair()
+
+
+def connections(port=None):
+    """
+    This function returns a pair of connected SocketConnection objects. In case a port is given, the connection is a
+    real TCP connection on that port, otherwise the sockets are created as a socket pair.
+    Args:
+        port: The int port for a TCP connection or None for a socket pair
+
+    Returns:
+    a tuple of two connected SocketConnection objects
+    """
+    if port is None:
+        sock1, sock2 = socket_pair()
+    else:
+        sock1, sock2 = sockets(port)
+    # Creating SocketConnection objects from these sockets
+    return SocketConnection(sock1), SocketConnection(sock2)